@@ -0,0 +1,147 @@
+from __future__ import annotations
+import argparse
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from apps.bench.synthetic import generate
+from src.adapters.logging import get_logger
+from src.adapters.reader import read_raw
+from src.adapters.reports import flush_reports
+from src.application import validation
+from src.application.flatten import flatten_events
+from src.application.transform_service import build_output_and_export
+from src.application.validation import validate_raw_schema
+from src.domain.schema_registry import DATASETS, DatasetSpec
+
+log = get_logger()
+
+RAW_FILES = {"pays": "pays.csv", "taps": "taps.json", "prints": "prints.json"}
+
+
+def bench_specs(data_dir: str) -> dict[str, DatasetSpec]:
+    return {
+        name: replace(
+            spec,
+            name=f"bench_{name}",
+            raw_path=f"{data_dir}/{RAW_FILES[name]}",
+        )
+        for name, spec in DATASETS.items()
+    }
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _timed(
+    results: list[dict],
+    stage: str,
+    dataset: str,
+    fn: Callable[[], Any],
+    rows: Callable[[Any], int],
+) -> Any:
+    start = time.perf_counter()
+    out = fn()
+    seconds = time.perf_counter() - start
+    n = rows(out)
+    results.append(
+        {
+            "stage": stage,
+            "dataset": dataset,
+            "rows": n,
+            "seconds": round(seconds, 6),
+            "rows_per_sec": round(n / seconds) if seconds else None,
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+        }
+    )
+    log.info("bench_stage", **results[-1])
+    return out
+
+
+def _report_rows(result: tuple[bool, str]) -> int:
+    flush_reports()
+    with open(result[1]) as f:
+        return int(json.load(f)["rows"])
+
+
+@contextmanager
+def _reports_to(report_dir: str) -> Iterator[None]:
+    previous = validation.REPORT_BASE
+    validation.REPORT_BASE = report_dir
+    try:
+        yield
+    finally:
+        flush_reports(strict=False)
+        validation.REPORT_BASE = previous
+
+
+def run(data_dir: str, out_dir: str) -> dict:
+    with _reports_to(f"{out_dir}/reports"):
+        return _run(data_dir, out_dir)
+
+
+def _run(data_dir: str, out_dir: str) -> dict:
+    results: list[dict] = []
+    flats = {}
+    for name, spec in bench_specs(data_dir).items():
+        _timed(
+            results,
+            "validate_raw_schema",
+            name,
+            lambda: validate_raw_schema(spec, strict=True),
+            _report_rows,
+        )
+        raw = _timed(
+            results, "read_raw", name, lambda: read_raw(spec), len
+        )
+        flats[name] = _timed(
+            results,
+            "flatten_events",
+            name,
+            lambda: flatten_events(spec, raw),
+            len,
+        )
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    _timed(
+        results,
+        "build_output_and_export",
+        "all",
+        lambda: build_output_and_export(flats, out_dir=out_dir),
+        lambda _: sum(df.height for df in flats.values()),
+    )
+    return {"data_dir": data_dir, "stages": results}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de etapas ETL")
+    parser.add_argument("--data", default="data/bench")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=None,
+        help="Si se indica, genera antes ese número de prints sintéticos",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", default=None, help="Ruta del resultado")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.rows:
+        generate(args.data, args.rows, args.seed)
+    report = run(args.data, f"{args.data}/out")
+    report["rows"] = args.rows
+    target = args.json or f"{args.data}/bench.json"
+    Path(target).write_text(json.dumps(report, indent=2))
+    log.info("bench_done", json=target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
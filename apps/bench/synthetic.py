@@ -0,0 +1,131 @@
+from __future__ import annotations
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+import polars as pl
+from src.adapters.logging import get_logger
+
+log = get_logger()
+
+VALUE_PROPS = {
+    "point": 30,
+    "cellphone_recharge": 22,
+    "prepaid": 16,
+    "credits_consumer": 12,
+    "transport": 10,
+    "link_cobro": 6,
+    "send_money": 4,
+}
+POSITIONS = {0: 50, 1: 25, 2: 15, 3: 10}
+TAP_RATE = 0.1
+PAY_RATE = 0.05
+CHUNK_ROWS = 1_000_000
+USERS_PER_ROW = 0.02
+HEAVY_USER_WEIGHT = 1_000
+
+
+def _weighted_pool(weights: dict) -> pl.Series:
+    return pl.Series(list(weights)).gather(
+        [i for i, w in enumerate(weights.values()) for _ in range(w)]
+    )
+
+
+def _user_pool(n_users: int) -> pl.Series:
+    rank = pl.int_range(1, n_users + 1, eager=True)
+    copies = (HEAVY_USER_WEIGHT / rank).ceil().cast(pl.Int64)
+    return pl.select(rank.repeat_by(copies).explode()).to_series()
+
+
+def _draw(pool: pl.Series, n: int, seed: int) -> pl.Series:
+    return pool.sample(n, with_replacement=True, seed=seed)
+
+
+def _prints_chunk(
+    n: int, seed: int, users: pl.Series, days: pl.Series
+) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "day": _draw(days, n, seed),
+            "position": _draw(_weighted_pool(POSITIONS), n, seed + 1),
+            "value_prop": _draw(_weighted_pool(VALUE_PROPS), n, seed + 2),
+            "user_id": _draw(users, n, seed + 3),
+        }
+    ).sort("day")
+
+
+def _events(flat: pl.DataFrame) -> pl.DataFrame:
+    return flat.select(
+        pl.col("day").dt.to_string("%Y-%m-%d"),
+        pl.struct("position", "value_prop").alias("event_data"),
+        "user_id",
+    )
+
+
+def _pays(flat: pl.DataFrame, seed: int) -> pl.DataFrame:
+    pays = flat.sample(fraction=PAY_RATE / TAP_RATE, seed=seed)
+    cents = pl.int_range(100, 200_000, eager=True)
+    total = _draw(cents, pays.height, seed + 1) / 100
+    return pays.select(
+        pl.col("day").alias("pay_date"),
+        total.alias("total"),
+        "user_id",
+        "value_prop",
+    )
+
+
+def generate(
+    out_dir: str,
+    rows: int,
+    seed: int = 42,
+    weeks: int = 5,
+    end: date = date(2020, 11, 29),
+) -> dict[str, str]:
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "prints": out / "prints.json",
+        "taps": out / "taps.json",
+        "pays": out / "pays.csv",
+    }
+    first = end - timedelta(weeks=weeks) + timedelta(days=1)
+    days = pl.date_range(first, end, eager=True)
+    users = _user_pool(max(int(rows * USERS_PER_ROW), 100))
+    with (
+        paths["prints"].open("wb") as prints_f,
+        paths["taps"].open("wb") as taps_f,
+        paths["pays"].open("wb") as pays_f,
+    ):
+        for i, start in enumerate(range(0, rows, CHUNK_ROWS)):
+            chunk_seed = seed + 10 * i
+            n = min(CHUNK_ROWS, rows - start)
+            flat = _prints_chunk(n, chunk_seed, users, days)
+            taps = flat.sample(fraction=TAP_RATE, seed=chunk_seed + 4)
+            _events(flat).write_ndjson(prints_f)
+            _events(taps).write_ndjson(taps_f)
+            _pays(taps, chunk_seed + 5).write_csv(
+                pays_f, include_header=i == 0
+            )
+    return {name: str(p) for name, p in paths.items()}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Genera prints/taps/pays sintéticos"
+    )
+    parser.add_argument("--out", default="data/bench")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--weeks", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    paths = generate(args.out, args.rows, args.seed, args.weeks)
+    log.info("synthetic_generated", rows=args.rows, paths=paths)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
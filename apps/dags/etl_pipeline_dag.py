@@ -1,38 +1,201 @@
 from __future__ import annotations
+from contextlib import ExitStack, nullcontext
 from datetime import datetime, timedelta, date
 from airflow import DAG
+from airflow.exceptions import AirflowSkipException
 from airflow.operators.python import PythonOperator
+from src.adapters.artifacts import (
+    clear_artifacts,
+    read_artifacts,
+    run_prefix,
+    sweep_artifacts,
+    write_artifacts,
+)
 from src.adapters.logging import get_logger
-from src.application.dq_and_load import load_and_prepare_all
-from src.application.transform_service import build_output_and_export
+from src.adapters.metrics import reset_spans, write_run_summary
+from src.adapters.reports import flush_reports
+from src.application.dq_and_load import encode_domains, load_and_prepare
+from src.application.run_cache import (
+    input_fingerprint,
+    is_unchanged,
+    save_fingerprint,
+)
+from src.application.sharding import (
+    check_engine,
+    export_shard,
+    merge_shards,
+)
+from src.application.streaming import (
+    configure_streaming,
+    streaming_features,
+)
+from src.application.transform_service import (
+    build_output_and_export,
+    stream_output_and_export,
+)
+from src.application.weekly_store import incremental_features
+from src.config.settings import (
+    ETL_ENGINE,
+    ETL_INCREMENTAL,
+    ETL_RUN_CACHE,
+    ETL_SOURCE,
+    TRANSFORM_SHARDS,
+)
+from src.domain.schema_registry import DATASETS
 
 log = get_logger()
 
 
-def load_data_callable(**context):
+def _as_of(context) -> date | None:
+    val = context["params"].get("as_of")
+    return date.fromisoformat(val) if val else None
+
+
+def _engine(context) -> str:
+    engine = context["params"].get("engine") or ETL_ENGINE
+    check_engine(engine, TRANSFORM_SHARDS, ETL_INCREMENTAL)
+    return engine
+
+
+def _engine_config(engine: str):
+    return configure_streaming() if engine == "streaming" else nullcontext()
+
+
+def _loaded_uris(context) -> dict[str, str]:
+    mapped = context["ti"].xcom_pull(task_ids="load_dataset") or []
+    return {name: uri for uris in mapped for name, uri in uris.items()}
+
+
+def _parts_dir(context) -> str:
+    return f"{run_prefix(context['run_id'])}/parts"
+
+
+def check_inputs_callable(**context):
+    reset_spans()
+    try:
+        sweep_artifacts()
+        engine = _engine(context)
+        fingerprint = input_fingerprint(_as_of(context), ETL_SOURCE, engine)
+    except Exception:
+        log.exception("check_inputs_failed")
+        raise
+    if ETL_RUN_CACHE and is_unchanged(fingerprint):
+        log.info("run_skipped", reason="inputs_unchanged")
+        raise AirflowSkipException("inputs unchanged")
+    return fingerprint
+
+
+def load_dataset_callable(name: str, **context):
+    reset_spans()
+    today = date.today().isoformat()
+    as_of = _as_of(context)
+    engine = _engine(context)
+    log.info("run_start_load", dataset=name, as_of=as_of, engine=engine)
+    try:
+        with _engine_config(engine):
+            df = load_and_prepare(
+                name, lazy=engine != "eager", as_of=as_of, source=ETL_SOURCE
+            )
+            uris = write_artifacts({name: df}, context["run_id"])
+        flush_reports()
+        summary = write_run_summary(
+            f"run_summary_load_{name}",
+            run_id=context["run_id"],
+            engine=engine,
+        )
+        log.info("load_done", dataset=name, today=today, summary=summary)
+        return uris
+    except Exception:
+        flush_reports(strict=False)
+        log.exception("load_failed", dataset=name, today=today)
+        raise
+
+
+def _transform_single(context, engine: str) -> str:
+    as_of = _as_of(context)
+    dfs = encode_domains(
+        read_artifacts(_loaded_uris(context), lazy=engine != "eager")
+    )
+    with ExitStack() as stack:
+        stack.enter_context(_engine_config(engine))
+        features = None
+        if ETL_INCREMENTAL:
+            features = incremental_features(dfs, as_of)
+        elif engine == "streaming":
+            features = stack.enter_context(streaming_features(dfs, as_of))
+        export = (
+            stream_output_and_export
+            if engine == "streaming"
+            else build_output_and_export
+        )
+        _, pq_path = export(dfs, as_of=as_of, features=features)
+    return pq_path
+
+
+def transform_shard_callable(shard: int, **context):
+    reset_spans()
     today = date.today().isoformat()
-    log.info("run_start_load", today=today)
+    engine = _engine(context)
+    log.info("run_start_transform", shard=shard, engine=engine)
     try:
-        dfs = load_and_prepare_all()
-        context["ti"].xcom_push(key="dfs", value=dfs)
-        log.info("load_done", today=today)
+        if TRANSFORM_SHARDS == 1:
+            uri = _transform_single(context, engine)
+        else:
+            dfs = encode_domains(
+                read_artifacts(_loaded_uris(context), lazy=True)
+            )
+            uri = export_shard(
+                dfs,
+                shard,
+                TRANSFORM_SHARDS,
+                _parts_dir(context),
+                _as_of(context),
+            )
+        summary = write_run_summary(
+            f"run_summary_transform_{shard}",
+            run_id=context["run_id"],
+            engine=engine,
+        )
+        log.info("transform_done", shard=shard, uri=uri, summary=summary)
+        return uri
     except Exception:
-        log.exception("load_failed", today=today)
+        log.exception("transform_failed", shard=shard, today=today)
         raise
 
 
-def export_data_callable(**context):
+def publish_callable(**context):
+    reset_spans()
     today = date.today().isoformat()
-    log.info("run_start_export", today=today)
     try:
-        dfs = context["ti"].xcom_pull(key="dfs", task_ids="load_data")
-        out_dir = build_output_and_export(dfs)
-        log.info("export_done", today=today, out_dir=out_dir)
+        if TRANSFORM_SHARDS > 1:
+            merge_shards(
+                TRANSFORM_SHARDS, _parts_dir(context), _as_of(context)
+            )
+        save_fingerprint(context["ti"].xcom_pull(task_ids="check_inputs"))
+        clear_artifacts(context["run_id"])
+        summary = write_run_summary(
+            "run_summary_publish", run_id=context["run_id"]
+        )
+        log.info(
+            "publish_done",
+            today=today,
+            shards=TRANSFORM_SHARDS,
+            summary=summary,
+        )
     except Exception:
-        log.exception("export_failed", today=today)
+        log.exception("publish_failed", today=today)
         raise
 
 
+def cleanup_failed_run(context):
+    run_id = context["run_id"]
+    try:
+        clear_artifacts(run_id)
+        log.info("artifacts_cleared_after_failure", run_id=run_id)
+    except Exception:
+        log.exception("artifacts_cleanup_failed", run_id=run_id)
+
+
 default_args = {
     "owner": "juan",
     "depends_on_past": False,
@@ -48,11 +211,19 @@ with DAG(
     start_date=datetime(2025, 1, 1),
     catchup=False,
     tags=["etl"],
+    on_failure_callback=cleanup_failed_run,
+    params={"as_of": None, "engine": ETL_ENGINE},
 ) as dag:
-    load_data = PythonOperator(
-        task_id="load_data", python_callable=load_data_callable
+    check_inputs = PythonOperator(
+        task_id="check_inputs", python_callable=check_inputs_callable
     )
-    export_data = PythonOperator(
-        task_id="export_data", python_callable=export_data_callable
+    load_dataset = PythonOperator.partial(
+        task_id="load_dataset", python_callable=load_dataset_callable
+    ).expand(op_kwargs=[{"name": name} for name in DATASETS])
+    transform_shard = PythonOperator.partial(
+        task_id="transform_shard", python_callable=transform_shard_callable
+    ).expand(op_kwargs=[{"shard": i} for i in range(TRANSFORM_SHARDS)])
+    publish = PythonOperator(
+        task_id="publish", python_callable=publish_callable
     )
-    load_data >> export_data
+    check_inputs >> load_dataset >> transform_shard >> publish
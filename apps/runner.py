@@ -1,24 +1,161 @@
 from __future__ import annotations
+import argparse
 import sys
+import time
+from contextlib import ExitStack
 from datetime import date
+import polars as pl
 from src.adapters.logging import get_logger
+from src.adapters.metrics import reset_spans, write_run_summary
+from src.adapters.reports import flush_reports
 from src.application.dq_and_load import load_and_prepare_all
-from src.application.transform_service import build_output_and_export
+from src.application.ingest import ingest_all
+from src.application.run_cache import (
+    input_fingerprint,
+    is_unchanged,
+    save_fingerprint,
+)
+from src.application.sharding import (
+    check_engine,
+    sharded_output_and_export,
+)
+from src.application.streaming import (
+    configure_streaming,
+    streaming_features,
+)
+from src.application.transform_service import (
+    build_output_and_export,
+    stream_output_and_export,
+)
+from src.application.weekly_store import (
+    backfill_and_export,
+    incremental_features,
+)
+from src.config.settings import (
+    ENGINES,
+    ETL_AS_OF,
+    ETL_ENGINE,
+    ETL_INCREMENTAL,
+    ETL_RUN_CACHE,
+    ETL_SOURCE,
+    TRANSFORM_SHARDS,
+)
 
 log = get_logger()
 
 
-def main():
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ETL pays/taps/prints")
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=ETL_AS_OF,
+        help="Fecha de corte YYYY-MM-DD (por defecto: última fecha en datos)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=ETL_ENGINE,
+        help="Motor de ejecución (por defecto: ETL_ENGINE)",
+    )
+    parser.add_argument(
+        "--ingest",
+        action="store_true",
+        help="Convierte los archivos crudos a Parquet particionado y termina",
+    )
+    parser.add_argument(
+        "--backfill",
+        nargs=2,
+        type=date.fromisoformat,
+        metavar=("DESDE", "HASTA"),
+        default=None,
+        help="Genera la salida de todas las semanas del rango en una pasada",
+    )
+    args = parser.parse_args(argv)
+    if args.backfill and args.backfill[0] > args.backfill[1]:
+        first, last = (d.isoformat() for d in args.backfill)
+        parser.error(
+            f"--backfill: DESDE ({first}) es posterior a HASTA ({last})"
+        )
+    return args
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    as_of = args.as_of.isoformat() if args.as_of else None
     today = date.today().isoformat()
-    log.info("run_start", today=today)
+    log.info(
+        "run_start",
+        today=today,
+        engine=args.engine,
+        source=ETL_SOURCE,
+        as_of=as_of,
+    )
+    reset_spans()
+    started = time.perf_counter()
+
+    def summary(status: str) -> str:
+        flush_reports(strict=status == "ok")
+        return write_run_summary(
+            status=status,
+            today=today,
+            engine=args.engine,
+            source=ETL_SOURCE,
+            as_of=as_of,
+            wall_s=round(time.perf_counter() - started, 6),
+        )
 
     try:
-        dfs = load_and_prepare_all()
-        out_dir = build_output_and_export(dfs)
-        log.info("run_done", today=today, out_dir=out_dir)
+        if args.ingest:
+            paths = ingest_all()
+            flush_reports()
+            log.info("run_done", today=today, curated=paths)
+            return 0
+        if args.backfill:
+            dfs = load_and_prepare_all(lazy=True, source=ETL_SOURCE)
+            path = backfill_and_export(dfs, *args.backfill)
+            log.info(
+                "run_done", today=today, backfill=path, summary=summary("ok")
+            )
+            return 0
+        check_engine(args.engine, TRANSFORM_SHARDS, ETL_INCREMENTAL)
+        fingerprint = input_fingerprint(args.as_of, ETL_SOURCE, args.engine)
+        if ETL_RUN_CACHE and is_unchanged(fingerprint):
+            log.info("run_skipped", today=today, reason="inputs_unchanged")
+            return 0
+        streaming = args.engine == "streaming"
+        with ExitStack() as stack:
+            if streaming:
+                stack.enter_context(configure_streaming())
+            dfs = load_and_prepare_all(
+                lazy=args.engine != "eager",
+                as_of=args.as_of,
+                source=ETL_SOURCE,
+            )
+            features: pl.DataFrame | pl.LazyFrame | None = None
+            if ETL_INCREMENTAL:
+                features = incremental_features(dfs, args.as_of)
+            elif streaming:
+                features = stack.enter_context(
+                    streaming_features(dfs, args.as_of)
+                )
+            export = (
+                sharded_output_and_export
+                if TRANSFORM_SHARDS > 1
+                else (
+                    stream_output_and_export
+                    if streaming
+                    else build_output_and_export
+                )
+            )
+            out_dir = export(dfs, as_of=args.as_of, features=features)
+        save_fingerprint(fingerprint)
+        log.info(
+            "run_done", today=today, out_dir=out_dir, summary=summary("ok")
+        )
         return 0
     except Exception:
-        log.exception("run_failed", today=today)
+        log.exception("run_failed", today=today, summary=summary("failed"))
         return 1
 
 
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import re
+import time
+from datetime import datetime
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters.logging import get_logger
+from src.config.paths import OUT_DATA_DIR
+from src.config.settings import ARTIFACTS_TTL_HOURS
+
+log = get_logger()
+
+ARTIFACTS_DIR = f"{OUT_DATA_DIR}/artifacts"
+
+
+def run_prefix(run_id: str) -> str:
+    return f"{ARTIFACTS_DIR}/{re.sub(r'[^A-Za-z0-9_.-]', '_', run_id)}"
+
+
+def write_artifacts(dfs: dict, run_id: str) -> dict:
+    prefix = run_prefix(run_id)
+    fs, path = fsspec.core.url_to_fs(prefix)
+    fs.makedirs(path, exist_ok=True)
+    uris: dict[str, str] = {}
+    for name, df in dfs.items():
+        uri = f"{prefix}/{name}.arrow"
+        with fsspec.open(uri, "wb") as f:
+            if isinstance(df, pl.LazyFrame):
+                df.sink_ipc(f, compression="uncompressed")
+            else:
+                df.write_ipc(f, compression="uncompressed")
+        uris[name] = uri
+    log.info("artifacts_written", run_id=run_id, uris=uris)
+    return uris
+
+
+def _read_artifact(uri: str, lazy: bool) -> pl.DataFrame | pl.LazyFrame:
+    fs, path = fsspec.core.url_to_fs(uri)
+    if "file" in fs.protocol:
+        if lazy:
+            return pl.scan_ipc(path, memory_map=True)
+        return pl.read_ipc(path, memory_map=True)
+    with fsspec.open(uri, "rb") as f:
+        df = pl.read_ipc(f)
+    return df.lazy() if lazy else df
+
+
+def read_artifacts(uris: dict[str, str], lazy: bool = False) -> dict:
+    dfs = {name: _read_artifact(uri, lazy) for name, uri in uris.items()}
+    log.info("artifacts_read", uris=uris)
+    return dfs
+
+
+def clear_artifacts(run_id: str) -> None:
+    fs, path = fsspec.core.url_to_fs(run_prefix(run_id))
+    if fs.exists(path):
+        fs.rm(path, recursive=True)
+
+
+def _mtime(info: dict) -> float:
+    for key in ("mtime", "LastModified", "created"):
+        ts = info.get(key)
+        if ts is not None:
+            return ts.timestamp() if isinstance(ts, datetime) else float(ts)
+    return 0.0
+
+
+def sweep_artifacts(
+    max_age_hours: int = ARTIFACTS_TTL_HOURS, now: float | None = None
+) -> list[str]:
+    fs, path = fsspec.core.url_to_fs(ARTIFACTS_DIR)
+    if not fs.exists(path):
+        return []
+    newest: dict[str, float] = {}
+    for name, info in fs.find(path, detail=True).items():
+        run = name.removeprefix(path).lstrip("/").split("/", 1)[0]
+        newest[run] = max(newest.get(run, 0.0), _mtime(info))
+    cutoff = (now or time.time()) - max_age_hours * 3600
+    stale = sorted(run for run, ts in newest.items() if ts < cutoff)
+    for run in stale:
+        fs.rm(f"{path}/{run}", recursive=True)
+    if stale:
+        log.info("artifacts_swept", runs=stale, max_age_hours=max_age_hours)
+    return stale
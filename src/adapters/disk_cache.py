@@ -0,0 +1,120 @@
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from pathlib import Path
+import fsspec  # type: ignore[import-untyped]
+from src.adapters.logging import get_logger
+from src.config.settings import RAW_CACHE_DIR, RAW_CACHE_MAX_MB
+
+log = get_logger()
+
+CACHE_DIR = RAW_CACHE_DIR
+MAX_BYTES = RAW_CACHE_MAX_MB * 1024 * 1024
+_BLOCK = 8 * 1024 * 1024
+_STRIPES = 64
+_LOCK = threading.Lock()
+_KEY_LOCKS = tuple(threading.Lock() for _ in range(_STRIPES))
+_VERIFIED: dict[Path, tuple[int, int]] = {}
+
+
+def _version(info: dict) -> str:
+    version = info.get("ETag") or info.get("mtime") or info.get("LastModified")
+    return str(version or info.get("created"))
+
+
+def _key(uri: str, version: str) -> str:
+    return hashlib.sha256(f"{uri}\n{version}".encode()).hexdigest()
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _sidecar(entry: Path) -> Path:
+    return entry.with_suffix(".sha256")
+
+
+def _key_lock(key: str) -> threading.Lock:
+    return _KEY_LOCKS[int(key[:8], 16) % _STRIPES]
+
+
+def _stamp(entry: Path) -> tuple[int, int]:
+    st = entry.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _is_valid(entry: Path, size: int | None) -> bool:
+    sidecar = _sidecar(entry)
+    if not entry.exists() or not sidecar.exists():
+        return False
+    stamp = _stamp(entry)
+    if size is not None and stamp[0] != size:
+        return False
+    if _VERIFIED.get(entry) == stamp:
+        return True
+    if sidecar.read_text() != _sha256(entry):
+        return False
+    _VERIFIED[entry] = stamp
+    return True
+
+
+def _download(fs, path: str, entry: Path) -> None:
+    part = entry.with_suffix(f".part{threading.get_ident()}")
+    h = hashlib.sha256()
+    with fs.open(path, "rb") as src, part.open("wb") as dst:
+        for block in iter(lambda: src.read(_BLOCK), b""):
+            h.update(block)
+            dst.write(block)
+    _sidecar(entry).write_text(h.hexdigest())
+    os.replace(part, entry)
+
+
+def _entries(cache_dir: Path) -> list[Path]:
+    return [p for p in cache_dir.iterdir() if not p.suffix]
+
+
+def evict(keep: Path | None = None) -> list[Path]:
+    cache_dir = Path(CACHE_DIR)
+    with _LOCK:
+        entries = sorted(_entries(cache_dir), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in entries)
+        evicted = []
+        for entry in entries:
+            if total <= MAX_BYTES:
+                break
+            if entry == keep:
+                continue
+            total -= entry.stat().st_size
+            entry.unlink()
+            _sidecar(entry).unlink(missing_ok=True)
+            _VERIFIED.pop(entry, None)
+            evicted.append(entry)
+    if evicted:
+        log.info("raw_cache_evicted", files=len(evicted), bytes=total)
+    return evicted
+
+
+def cached_path(uri: str) -> str:
+    fs, path = fsspec.core.url_to_fs(uri)
+    info = fs.info(path)
+    key = _key(uri, _version(info))
+    entry = Path(CACHE_DIR) / key
+    with _key_lock(key):
+        if _is_valid(entry, info.get("size")):
+            os.utime(entry)
+            _VERIFIED[entry] = _stamp(entry)
+            log.info("raw_cache_hit", uri=uri, path=str(entry))
+            return str(entry)
+        if entry.exists():
+            log.warning("raw_cache_corrupt", uri=uri, path=str(entry))
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        _download(fs, path, entry)
+        _VERIFIED[entry] = _stamp(entry)
+        log.info("raw_cache_miss", uri=uri, path=str(entry))
+    evict(keep=entry)
+    return str(entry)
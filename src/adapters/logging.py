@@ -1,11 +1,113 @@
+from __future__ import annotations
+import os
 import sys
+import atexit
 import logging
+import threading
 import warnings
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 import structlog
 from structlog.stdlib import ProcessorFormatter
 
+PROFILES = ("dev", "prod")
+
+_prod_lock = threading.Lock()
+_prod_listener: QueueListener | None = None
+
+
+class _RecordQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _redirect_warnings() -> None:
+    logging.captureWarnings(True)
+    logging.getLogger("py.warnings").propagate = True
+
+    def warning_to_log(
+        message, category, filename, lineno, file=None, line=None
+    ):
+        logging.getLogger("py.warnings").warning(
+            f"{category.__name__}: {message}",
+            extra={
+                "event": "python_warning",
+                "warn_category": category.__name__,
+                "warn_message": str(message),
+                "warn_file": filename,
+                "warn_line": lineno,
+            },
+        )
+
+    warnings.showwarning = warning_to_log
+
+
+def stop_prod_listener() -> None:
+    global _prod_listener
+    with _prod_lock:
+        if _prod_listener is not None:
+            _prod_listener.stop()
+            _prod_listener = None
+
+
+def _configure_prod() -> None:
+    global _prod_listener
+    with _prod_lock:
+        if _prod_listener is not None:
+            return
+        level = logging.INFO
+        timestamper = structlog.processors.TimeStamper(
+            fmt="iso", utc=True, key="ts"
+        )
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(
+            ProcessorFormatter(
+                processor=structlog.processors.JSONRenderer(),
+                foreign_pre_chain=[
+                    structlog.stdlib.add_logger_name,
+                    structlog.stdlib.add_log_level,
+                    timestamper,
+                ],
+            )
+        )
+        queue: SimpleQueue = SimpleQueue()
+        listener = QueueListener(queue, stream)
+        listener.start()
+        atexit.register(stop_prod_listener)
+
+        handler = _RecordQueueHandler(queue)
+        handler.setLevel(level)
+        root = logging.getLogger()
+        root.handlers = [handler]
+        root.setLevel(level)
+        _redirect_warnings()
+
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.PositionalArgumentsFormatter(),
+                structlog.processors.format_exc_info,
+                timestamper,
+                ProcessorFormatter.wrap_for_formatter,
+            ],
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+        _prod_listener = listener
+
 
 def get_logger():
+    profile = (os.getenv("LOG_PROFILE") or "dev").strip().lower()
+    if profile not in PROFILES:
+        raise ValueError(f"LOG_PROFILE={profile!r} not in {PROFILES}")
+    if profile == "prod":
+        _configure_prod()
+        return structlog.get_logger()
+
     level = logging.INFO
 
     handler = logging.StreamHandler(sys.stdout)
@@ -27,24 +129,7 @@ def get_logger():
     root.handlers = [handler]
     root.setLevel(level)
 
-    logging.captureWarnings(True)
-    logging.getLogger("py.warnings").propagate = True
-
-    def warning_to_log(
-        message, category, filename, lineno, file=None, line=None
-    ):
-        logging.getLogger("py.warnings").warning(
-            f"{category.__name__}: {message}",
-            extra={
-                "event": "python_warning",
-                "warn_category": category.__name__,
-                "warn_message": str(message),
-                "warn_file": filename,
-                "warn_line": lineno,
-            },
-        )
-
-    warnings.showwarning = warning_to_log
+    _redirect_warnings()
 
     structlog.configure(
         processors=[
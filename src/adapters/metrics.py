@@ -0,0 +1,99 @@
+from __future__ import annotations
+import json
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Iterator
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters.logging import get_logger
+from src.config.paths import EXPECTATIONS_REPORTS_DIR
+
+log = get_logger()
+
+_SPANS: list[Span] = []
+_LOCK = threading.Lock()
+
+
+@dataclass
+class Span:
+    stage: str
+    dataset: str | None = None
+    rows_in: int | None = None
+    rows_out: int | None = None
+    bytes_read: int | None = None
+    bytes_written: int | None = None
+    estimated_size: int | None = None
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_delta_mb: float = 0.0
+    plan_only: bool = False
+    status: str = "ok"
+
+    def output(self, frame: pl.DataFrame | pl.LazyFrame) -> None:
+        if isinstance(frame, pl.DataFrame):
+            self.rows_out = frame.height
+            self.estimated_size = int(frame.estimated_size())
+        else:
+            self.plan_only = True
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def uri_size(uri: str) -> int | None:
+    try:
+        fs, path = fsspec.core.url_to_fs(uri)
+        return int(fs.size(path))
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+@contextmanager
+def stage_span(
+    stage: str,
+    dataset: str | None = None,
+    rows_in: int | None = None,
+    bytes_read: int | None = None,
+) -> Iterator[Span]:
+    span = Span(stage, dataset, rows_in=rows_in, bytes_read=bytes_read)
+    rss = _peak_rss_mb()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield span
+    except BaseException:
+        span.status = "error"
+        raise
+    finally:
+        span.wall_s = round(time.perf_counter() - wall, 6)
+        span.cpu_s = round(time.process_time() - cpu, 6)
+        span.peak_rss_delta_mb = round(_peak_rss_mb() - rss, 1)
+        with _LOCK:
+            _SPANS.append(span)
+        log.info("stage_span", **asdict(span))
+
+
+def reset_spans() -> None:
+    with _LOCK:
+        _SPANS.clear()
+
+
+def spans() -> list[Span]:
+    with _LOCK:
+        return list(_SPANS)
+
+
+def write_run_summary(name: str = "run_summary", **context: object) -> str:
+    recorded = [asdict(s) for s in spans()]
+    payload = {**context, "stages": recorded}
+    base = str(EXPECTATIONS_REPORTS_DIR).rstrip("/")
+    uri = f"{base}/{name}.json"
+    fs, path = fsspec.core.url_to_fs(uri)
+    fs.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+    with fsspec.open(uri, "w") as f:
+        f.write(json.dumps(payload, ensure_ascii=False, indent=2))
+    log.info("run_summary_written", report=uri, stages=len(recorded))
+    return uri
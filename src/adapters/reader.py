@@ -1,19 +1,52 @@
 from __future__ import annotations
 import polars as pl
+from src.adapters import storage
 from src.adapters.logging import get_logger
-from src.domain.schema_registry import DatasetSpec
+from src.domain.schema_registry import PARTITION_COL, DatasetSpec
 
 log = get_logger()
 
 
 def read_raw(spec: DatasetSpec) -> pl.DataFrame:
     if spec.kind == "pays":
-        df = pl.read_csv(spec.raw_path, schema=spec.raw_schema)
+        df = storage.read_csv(spec.raw_path, schema=spec.raw_schema)
     elif spec.kind == "events":
-        df = pl.read_ndjson(spec.raw_path, schema=spec.raw_schema)
+        df = storage.read_ndjson(spec.raw_path, schema=spec.raw_schema)
     else:
         raise ValueError(spec.kind)
     log.info(
         "read_raw_ok", dataset=spec.name, rows=df.height, cols=list(df.columns)
     )
     return df
+
+
+def scan_raw(spec: DatasetSpec) -> pl.LazyFrame:
+    if spec.kind == "pays":
+        lf = storage.scan_csv(spec.raw_path, schema=spec.raw_schema)
+    elif spec.kind == "events":
+        lf = storage.scan_ndjson(spec.raw_path, schema=spec.raw_schema)
+    else:
+        raise ValueError(spec.kind)
+    log.info(
+        "scan_raw_ok",
+        dataset=spec.name,
+        cols=lf.collect_schema().names(),
+    )
+    return lf
+
+
+def scan_curated(spec: DatasetSpec) -> pl.LazyFrame:
+    if not spec.curated_path:
+        raise ValueError(f"{spec.name} has no curated_path")
+    lf = storage.scan_parquet(
+        f"{spec.curated_path}/**/*.parquet",
+        hive_partitioning=True,
+        hive_schema={PARTITION_COL: pl.Date},
+    )
+    log.info(
+        "scan_curated_ok",
+        dataset=spec.name,
+        path=spec.curated_path,
+        cols=lf.collect_schema().names(),
+    )
+    return lf
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import atexit
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import fsspec  # type: ignore[import-untyped]
+from src.adapters.logging import get_logger
+from src.config.settings import REPORT_WORKERS, REPORT_WRITE_MODE
+
+log = get_logger()
+
+
+def _put(uri: str, text: str) -> str:
+    with fsspec.open(uri, "w") as f:
+        f.write(text)
+    return uri
+
+
+class ReportSink:
+    def __init__(self, mode: str = "sync", workers: int = 4) -> None:
+        self.mode = mode
+        self.workers = workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: list[Future] = []
+        self._lock = threading.Lock()
+
+    def write(self, uri: str, payload: dict) -> str:
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+        if self.mode == "sync":
+            return _put(uri, text)
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="reports"
+                )
+            self._pending.append(self._pool.submit(_put, uri, text))
+        return uri
+
+    def flush(self, strict: bool = True) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = []
+        for fut in pending:
+            exc = fut.exception()
+            if exc is not None:
+                errors.append(exc)
+                log.error("report_write_failed", error=str(exc))
+        if pending:
+            log.info(
+                "reports_flushed", reports=len(pending), failed=len(errors)
+            )
+        if errors and strict:
+            raise errors[0]
+        return len(pending) - len(errors)
+
+
+REPORTS = ReportSink(REPORT_WRITE_MODE, REPORT_WORKERS)
+
+
+def write_report(uri: str, payload: dict) -> str:
+    return REPORTS.write(uri, payload)
+
+
+def flush_reports(strict: bool = True) -> int:
+    return REPORTS.flush(strict)
+
+
+atexit.register(flush_reports, strict=False)
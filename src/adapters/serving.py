@@ -0,0 +1,74 @@
+from __future__ import annotations
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters.logging import get_logger
+
+log = get_logger()
+
+SERVING_NAME = "serving"
+SERVING_KEY = "user_id"
+TABLE_FILE = "features.arrow"
+INDEX_FILE = "index.arrow"
+
+
+def _write_ipc(df: pl.DataFrame, uri: str) -> None:
+    with fsspec.open(uri, "wb") as f:
+        df.write_ipc(f, compression="uncompressed")
+
+
+def _read_ipc(uri: str) -> pl.DataFrame:
+    fs, path = fsspec.core.url_to_fs(uri)
+    if "file" in fs.protocol:
+        return pl.read_ipc(path, memory_map=True)
+    with fsspec.open(uri, "rb") as f:
+        return pl.read_ipc(f)
+
+
+def offset_index(table: pl.DataFrame) -> pl.DataFrame:
+    return (
+        table.select(SERVING_KEY)
+        .with_row_index("start")
+        .group_by(SERVING_KEY, maintain_order=True)
+        .agg(pl.col("start").first(), pl.len().alias("length"))
+    )
+
+
+def write_serving_index(out: pl.DataFrame, out_dir: str) -> str:
+    serving_dir = f"{out_dir}/{SERVING_NAME}"
+    fs, path = fsspec.core.url_to_fs(serving_dir)
+    fs.makedirs(path, exist_ok=True)
+    table = out.filter(pl.col(SERVING_KEY).is_not_null())
+    if table.height < out.height:
+        log.warning(
+            "serving_index_null_keys_dropped", rows=out.height - table.height
+        )
+    if not table.get_column(SERVING_KEY).is_sorted():
+        table = table.sort(SERVING_KEY, maintain_order=True)
+    index = offset_index(table)
+    _write_ipc(table, f"{serving_dir}/{TABLE_FILE}")
+    _write_ipc(index, f"{serving_dir}/{INDEX_FILE}")
+    log.info(
+        "serving_index_written",
+        path=serving_dir,
+        rows=table.height,
+        keys=index.height,
+    )
+    return serving_dir
+
+
+class FeatureLookup:
+    def __init__(self, serving_dir: str) -> None:
+        self.table = _read_ipc(f"{serving_dir}/{TABLE_FILE}")
+        index = _read_ipc(f"{serving_dir}/{INDEX_FILE}")
+        self._keys = index.get_column(SERVING_KEY)
+        self._starts = index.get_column("start")
+        self._lengths = index.get_column("length")
+
+    def __len__(self) -> int:
+        return self._keys.len()
+
+    def get(self, user_id: int) -> pl.DataFrame:
+        i = self._keys.search_sorted(user_id, side="left")
+        if i >= self._keys.len() or self._keys[i] != user_id:
+            return self.table.clear()
+        return self.table.slice(self._starts[i], self._lengths[i])
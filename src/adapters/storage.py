@@ -0,0 +1,122 @@
+from __future__ import annotations
+import os
+import uuid
+from typing import Any
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters import disk_cache
+from src.config.settings import (
+    EXPORT_BLOCK_SIZE_MB,
+    RAW_CACHE,
+    STORAGE_BACKEND,
+)
+
+_ENV_OPTIONS = (
+    ("aws_access_key_id", ("AWS_ACCESS_KEY_ID",)),
+    ("aws_secret_access_key", ("AWS_SECRET_ACCESS_KEY",)),
+    ("aws_region", ("AWS_DEFAULT_REGION", "AWS_REGION")),
+    ("aws_endpoint_url", ("S3_ENDPOINT_URL", "AWS_ENDPOINT_URL")),
+)
+
+
+def is_remote(uri: str | os.PathLike) -> bool:
+    uri = str(uri)
+    return "://" in uri and not uri.startswith("file://")
+
+
+def use_fsspec(uri: str) -> bool:
+    return is_remote(uri) and STORAGE_BACKEND == "fsspec"
+
+
+def storage_options(uri: str) -> dict[str, str] | None:
+    if not is_remote(uri):
+        return None
+    opts: dict[str, str] = {}
+    for key, env_vars in _ENV_OPTIONS:
+        val = next((os.environ[v] for v in env_vars if os.getenv(v)), None)
+        if val:
+            opts[key] = val
+    if opts.get("aws_endpoint_url", "").startswith("http://"):
+        opts["aws_allow_http"] = "true"
+    return opts or None
+
+
+def _cached(uri: str) -> str:
+    if is_remote(uri) and (RAW_CACHE or use_fsspec(uri)):
+        return disk_cache.cached_path(str(uri))
+    return uri
+
+
+def open_write(uri: str):
+    return fsspec.open(
+        uri, "wb", block_size=EXPORT_BLOCK_SIZE_MB * 1024 * 1024
+    )
+
+
+def scan_csv(uri: str, **kwargs: Any) -> pl.LazyFrame:
+    uri = _cached(uri)
+    return pl.scan_csv(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def read_csv(uri: str, **kwargs: Any) -> pl.DataFrame:
+    uri = _cached(uri)
+    return pl.read_csv(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def scan_ndjson(uri: str, **kwargs: Any) -> pl.LazyFrame:
+    uri = _cached(uri)
+    return pl.scan_ndjson(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def read_ndjson(uri: str, **kwargs: Any) -> pl.DataFrame:
+    uri = _cached(uri)
+    return pl.read_ndjson(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def scan_parquet(uri: str, **kwargs: Any) -> pl.LazyFrame:
+    return pl.scan_parquet(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def read_parquet(uri: str, **kwargs: Any) -> pl.DataFrame:
+    if use_fsspec(uri):
+        return pl.read_parquet(disk_cache.cached_path(uri), **kwargs)
+    return pl.read_parquet(uri, storage_options=storage_options(uri), **kwargs)
+
+
+def write_parquet(df: pl.DataFrame, uri: str, **kwargs: Any) -> str:
+    if use_fsspec(uri):
+        with open_write(uri) as f:
+            df.write_parquet(f, **kwargs)
+    else:
+        df.write_parquet(uri, storage_options=storage_options(uri), **kwargs)
+    return uri
+
+
+def write_csv(df: pl.DataFrame, uri: str) -> str:
+    if use_fsspec(uri):
+        with open_write(uri) as f:
+            df.write_csv(f)
+    else:
+        df.write_csv(uri, storage_options=storage_options(uri))
+    return uri
+
+
+def remove_dir(uri: str) -> None:
+    fs, path = fsspec.core.url_to_fs(uri)
+    if fs.exists(path):
+        fs.rm(path, recursive=True)
+
+
+def staging_dir(uri: str) -> str:
+    return f"{uri}.tmp-{uuid.uuid4().hex}"
+
+
+def swap_dir(staging: str, uri: str) -> None:
+    fs, path = fsspec.core.url_to_fs(uri)
+    _, staging_path = fsspec.core.url_to_fs(staging)
+    retired = f"{path}.old-{uuid.uuid4().hex}"
+    if fs.exists(path):
+        fs.mv(path, retired, recursive=True)
+    fs.mv(staging_path, path, recursive=True)
+    if fs.exists(retired):
+        fs.rm(retired, recursive=True)
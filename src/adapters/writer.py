@@ -0,0 +1,129 @@
+from __future__ import annotations
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from contextlib import ExitStack
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters import storage
+from src.adapters.logging import get_logger
+from src.config.settings import (
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_ROW_GROUP_SIZE,
+    PARQUET_STATISTICS,
+)
+
+log = get_logger()
+
+
+@dataclass(frozen=True)
+class ParquetOptions:
+    compression: str = "zstd"
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    statistics: bool = True
+
+    def kwargs(self) -> dict:
+        return {
+            "compression": (
+                "uncompressed"
+                if self.compression == "none"
+                else self.compression
+            ),
+            "compression_level": self.compression_level,
+            "row_group_size": self.row_group_size,
+            "statistics": self.statistics,
+        }
+
+
+PARQUET_OPTIONS = ParquetOptions(
+    compression=PARQUET_COMPRESSION,
+    compression_level=PARQUET_COMPRESSION_LEVEL,
+    row_group_size=PARQUET_ROW_GROUP_SIZE,
+    statistics=PARQUET_STATISTICS,
+)
+
+
+def _sink_target(uri: str, stack: ExitStack) -> tuple[Any, dict]:
+    if storage.use_fsspec(uri):
+        return stack.enter_context(storage.open_write(uri)), {}
+    return uri, {"storage_options": storage.storage_options(uri)}
+
+
+def write_outputs(
+    df: pl.DataFrame,
+    csv_uri: str,
+    parquet_uri: str,
+    options: ParquetOptions = PARQUET_OPTIONS,
+) -> tuple[str, str]:
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        csv_job = pool.submit(storage.write_csv, df, csv_uri)
+        pq_job = pool.submit(
+            storage.write_parquet, df, parquet_uri, **options.kwargs()
+        )
+        written = csv_job.result(), pq_job.result()
+    log.info("outputs_written", csv=csv_uri, parquet=parquet_uri)
+    return written
+
+
+def sink_outputs(
+    lf: pl.LazyFrame,
+    csv_uri: str,
+    parquet_uri: str,
+    options: ParquetOptions = PARQUET_OPTIONS,
+) -> tuple[str, str]:
+    with ExitStack() as stack:
+        fc, csv_kw = _sink_target(csv_uri, stack)
+        fp, pq_kw = _sink_target(parquet_uri, stack)
+        pl.collect_all(
+            [
+                lf.sink_csv(fc, lazy=True, **csv_kw),
+                lf.sink_parquet(
+                    fp, lazy=True, **pq_kw, **options.kwargs()
+                ),
+            ],
+            engine="streaming",
+        )
+    log.info("outputs_written", csv=csv_uri, parquet=parquet_uri)
+    return csv_uri, parquet_uri
+
+
+def manifest_uri(parquet_uri: str) -> str:
+    return f"{parquet_uri.removesuffix('.parquet')}.manifest.json"
+
+
+def write_manifest(
+    parquet_uri: str,
+    sort_by: tuple[str, ...] = (),
+    options: ParquetOptions = PARQUET_OPTIONS,
+    frame: pl.DataFrame | None = None,
+) -> str:
+    lf = (
+        frame.lazy()
+        if frame is not None
+        else storage.scan_parquet(parquet_uri)
+    )
+    schema = lf.collect_schema()
+    stats = lf.select(
+        pl.len().alias("rows"),
+        *(pl.col(c).min().alias(f"{c}__min") for c in sort_by),
+        *(pl.col(c).max().alias(f"{c}__max") for c in sort_by),
+    ).collect()
+    payload = {
+        "file": parquet_uri.rsplit("/", 1)[-1],
+        "rows": stats["rows"].item(),
+        "sort_by": list(sort_by),
+        "key_ranges": {
+            c: [stats[f"{c}__min"].item(), stats[f"{c}__max"].item()]
+            for c in sort_by
+        },
+        "parquet": options.kwargs(),
+        "schema": {c: str(t) for c, t in schema.items()},
+    }
+    uri = manifest_uri(parquet_uri)
+    with fsspec.open(uri, "w") as f:
+        f.write(json.dumps(payload, ensure_ascii=False, indent=2, default=str))
+    log.info("parquet_manifest_written", manifest=uri, sort_by=sort_by)
+    return uri
@@ -1,34 +1,199 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Literal, NoReturn, overload
 import polars as pl
 from src.adapters.logging import get_logger
-from src.domain.schema_registry import DATASETS
-from src.adapters.reader import read_raw
-from src.application.validation import validate_raw_schema
+from src.adapters.metrics import stage_span, uri_size
+from src.domain.schema_registry import (
+    CATEGORICAL_DOMAINS,
+    DATASETS,
+    DatasetSpec,
+    FrameT,
+)
+from src.adapters.reader import scan_curated, scan_raw
+from src.application.validation import read_validated, validate_raw_schema
 from src.application.flatten import flatten_events, validate_flat_columns
+from src.application.transform_service import between_dates, window_bounds
+from src.config.settings import LOAD_WORKERS
 
 log = get_logger()
 
+SOURCES = ("raw", "curated")
 
-def load_and_prepare_all() -> dict[str, pl.DataFrame]:
-    ready: dict[str, pl.DataFrame] = {}
-    for name, spec in DATASETS.items():
-        ok_raw, rep_raw = validate_raw_schema(spec, df=None, strict=True)
-        if not ok_raw:
-            raise AssertionError(
-                f"RAW schema failed for {name}. See report: {rep_raw}"
-            )
-        raw_df = read_raw(spec)
+
+def _ready(name: str, frame: FrameT) -> FrameT:
+    log.info(
+        "dataset_ready",
+        dataset=name,
+        rows=frame.height if isinstance(frame, pl.DataFrame) else None,
+        cols=frame.collect_schema().names(),
+        lazy=isinstance(frame, pl.LazyFrame),
+    )
+    return frame
+
+
+def _narrow(spec: DatasetSpec, frame: FrameT) -> FrameT:
+    cols = frame.collect_schema().names()
+    return frame.with_columns(
+        pl.col(c).cast(t) for c, t in spec.compact_types.items() if c in cols
+    )
+
+
+def _prepare(name: str, spec: DatasetSpec, raw_df: FrameT) -> FrameT:
+    rows_in = raw_df.height if isinstance(raw_df, pl.DataFrame) else None
+    with stage_span("flatten", name, rows_in=rows_in) as span:
         flat_df = flatten_events(spec, raw_df)
-        ok_flat, rep_flat = validate_flat_columns(spec, flat_df, strict=True)
-        if not ok_flat:
-            raise AssertionError(
-                f"FLAT schema failed for {name}. See report: {rep_flat}"
-            )
-        ready[name] = flat_df
-        log.info(
-            "dataset_ready",
-            dataset=name,
-            rows=flat_df.height,
-            cols=list(flat_df.columns),
+        span.output(flat_df)
+    ok_flat, rep_flat = validate_flat_columns(spec, flat_df, strict=True)
+    if not ok_flat:
+        raise AssertionError(
+            f"FLAT schema failed for {name}. See report: {rep_flat}"
         )
-    return ready
+    return _ready(name, _narrow(spec, flat_df))
+
+
+def _scan_window(
+    spec: DatasetSpec, lf: pl.LazyFrame, as_of: date | None
+) -> pl.LazyFrame:
+    if as_of is None or not spec.date_col:
+        return lf
+    first, last = window_bounds(as_of)
+    return between_dates(lf, spec.date_col, first, last)
+
+
+def _raise_raw(name: str, report: str) -> NoReturn:
+    raise AssertionError(f"RAW schema failed for {name}. See report: {report}")
+
+
+def _load_dataset(
+    name: str,
+    spec: DatasetSpec,
+    lazy: bool,
+    as_of: date | None,
+    source: str,
+) -> pl.DataFrame | pl.LazyFrame:
+    if source == "curated":
+        lf = _narrow(spec, _scan_window(spec, scan_curated(spec), as_of))
+        if lazy:
+            return _ready(name, lf)
+        with stage_span("read", name) as span:
+            df = lf.collect()
+            span.output(df)
+        return _ready(name, df)
+    bytes_read = uri_size(spec.raw_path)
+    if not lazy and as_of is None:
+        with stage_span("read_validated", name, bytes_read=bytes_read) as s:
+            raw_df, ok_raw, rep_raw = read_validated(spec, strict=True)
+            if raw_df is not None:
+                s.output(raw_df)
+        if not ok_raw or raw_df is None:
+            _raise_raw(name, rep_raw)
+        return _prepare(name, spec, raw_df)
+    with stage_span("validate", name, bytes_read=bytes_read):
+        ok_raw, rep_raw = validate_raw_schema(spec, df=None, strict=True)
+    if not ok_raw:
+        _raise_raw(name, rep_raw)
+    lf = _scan_window(spec, scan_raw(spec), as_of)
+    if lazy:
+        return _prepare(name, spec, lf)
+    with stage_span("read", name, bytes_read=bytes_read) as span:
+        df = lf.collect()
+        span.output(df)
+    return _prepare(name, spec, df)
+
+
+def _domain_dtype(
+    dfs: dict, column: str, domain: pl.Enum
+) -> pl.Enum | pl.Categorical:
+    frames = [f for f in dfs.values() if column in f.collect_schema()]
+    lazy = any(isinstance(f, pl.LazyFrame) for f in frames)
+    uniques = [
+        f.select(pl.col(column).cast(pl.Utf8).unique().drop_nulls())
+        for f in frames
+    ]
+    if lazy:
+        uniques = pl.collect_all([u.lazy() for u in uniques])
+    known = domain.categories.to_list()
+    unseen: set[str] = set()
+    for df in uniques:
+        values = df.to_series()
+        unseen.update(values.filter(~values.is_in(known)))
+    if unseen:
+        log.warning(
+            "categorical_domain_unseen", column=column, values=sorted(unseen)
+        )
+        return pl.Categorical()
+    return domain
+
+
+def encode_domains(dfs: dict) -> dict:
+    for column, domain in CATEGORICAL_DOMAINS.items():
+        dtype = _domain_dtype(dfs, column, domain)
+        dfs = {
+            name: (
+                frame.with_columns(pl.col(column).cast(dtype))
+                if column in frame.collect_schema()
+                else frame
+            )
+            for name, frame in dfs.items()
+        }
+    return dfs
+
+
+def load_and_prepare(
+    name: str,
+    lazy: bool = False,
+    as_of: date | None = None,
+    source: str = "raw",
+) -> pl.DataFrame | pl.LazyFrame:
+    if source not in SOURCES:
+        raise ValueError(source)
+    return _load_dataset(name, DATASETS[name], lazy, as_of, source)
+
+
+@overload
+def load_and_prepare_all(
+    lazy: Literal[False] = ...,
+    as_of: date | None = ...,
+    source: str = ...,
+    workers: int | None = ...,
+) -> dict[str, pl.DataFrame]: ...
+
+
+@overload
+def load_and_prepare_all(
+    lazy: Literal[True],
+    as_of: date | None = ...,
+    source: str = ...,
+    workers: int | None = ...,
+) -> dict[str, pl.LazyFrame]: ...
+
+
+@overload
+def load_and_prepare_all(
+    lazy: bool,
+    as_of: date | None = ...,
+    source: str = ...,
+    workers: int | None = ...,
+) -> dict[str, pl.DataFrame] | dict[str, pl.LazyFrame]: ...
+
+
+def load_and_prepare_all(
+    lazy: bool = False,
+    as_of: date | None = None,
+    source: str = "raw",
+    workers: int | None = None,
+) -> dict:
+    if source not in SOURCES:
+        raise ValueError(source)
+    names = list(DATASETS)
+    n = min(workers or LOAD_WORKERS, len(names))
+
+    def load(name: str) -> pl.DataFrame | pl.LazyFrame:
+        return load_and_prepare(name, lazy, as_of, source)
+
+    if n <= 1:
+        return encode_domains({name: load(name) for name in names})
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return encode_domains(dict(zip(names, pool.map(load, names))))
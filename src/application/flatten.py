@@ -1,9 +1,8 @@
 from __future__ import annotations
-import json
 import polars as pl
-import fsspec  # type: ignore[import-untyped]
 from src.adapters.logging import get_logger
-from src.domain.schema_registry import DatasetSpec
+from src.adapters.reports import write_report
+from src.domain.schema_registry import DatasetSpec, FrameT
 from src.config.paths import EXPECTATIONS_REPORTS_DIR
 
 log = get_logger()
@@ -17,30 +16,30 @@ def _join_report_path(dataset: str, filename: str) -> str:
 
 
 def _write_report(dataset: str, filename: str, payload: dict) -> str:
-    uri = _join_report_path(dataset, filename)
-    with fsspec.open(uri, "w") as f:
-        f.write(json.dumps(payload, ensure_ascii=False, indent=2))
-    return uri
+    return write_report(_join_report_path(dataset, filename), payload)
 
 
-def flatten_events(spec: DatasetSpec, df_raw: pl.DataFrame) -> pl.DataFrame:
+def flatten_events(spec: DatasetSpec, df_raw: FrameT) -> FrameT:
     if spec.kind != "events":
         return df_raw
     df = df_raw
-    if "event_data" in df.columns:
+    if "event_data" in df.collect_schema().names():
         df = df.unnest("event_data")
-    keep = [c for c in spec.flat_expected_cols if c in df.columns]
+    columns = df.collect_schema().names()
+    keep = [c for c in spec.flat_expected_cols if c in columns]
     return df.select(keep) if keep else df
 
 
 def validate_flat_columns(
-    spec: DatasetSpec, df_flat: pl.DataFrame, strict: bool = True
+    spec: DatasetSpec,
+    df_flat: pl.DataFrame | pl.LazyFrame,
+    strict: bool = True,
 ) -> tuple[bool, str]:
     if spec.kind != "events":
         return True, ""
 
     expected_cols = list(spec.flat_expected_cols)
-    present_cols = list(df_flat.columns)
+    present_cols = df_flat.collect_schema().names()
     missing = [c for c in expected_cols if c not in present_cols]
     new_cols = [c for c in present_cols if c not in expected_cols]
     ok = (not missing) and (not new_cols)
@@ -48,7 +47,9 @@ def validate_flat_columns(
     report = {
         "dataset": spec.name,
         "stage": "flat",
-        "rows": int(df_flat.height),
+        "rows": (
+            int(df_flat.height) if isinstance(df_flat, pl.DataFrame) else None
+        ),
         "expected_columns": expected_cols,
         "present_columns": present_cols,
         "missing_columns": missing,
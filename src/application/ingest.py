@@ -0,0 +1,41 @@
+from __future__ import annotations
+import polars as pl
+from src.adapters.logging import get_logger
+from src.adapters.storage import (
+    remove_dir,
+    staging_dir,
+    storage_options,
+    swap_dir,
+)
+from src.application.dq_and_load import load_and_prepare_all
+from src.domain.schema_registry import DATASETS, PARTITION_COL, DatasetSpec
+
+log = get_logger()
+
+
+def ingest_dataset(spec: DatasetSpec, flat: pl.LazyFrame) -> str:
+    if not spec.curated_path or not spec.date_col:
+        raise ValueError(f"{spec.name} has no curated_path/date_col")
+    staging = staging_dir(spec.curated_path)
+    try:
+        flat.with_columns(
+            pl.col(spec.date_col).dt.truncate("1w").alias(PARTITION_COL)
+        ).sink_parquet(
+            pl.PartitionByKey(staging, by=PARTITION_COL, include_key=False),
+            mkdir=True,
+            storage_options=storage_options(staging),
+        )
+    except Exception:
+        remove_dir(staging)
+        raise
+    swap_dir(staging, spec.curated_path)
+    log.info("ingest_done", dataset=spec.name, path=spec.curated_path)
+    return spec.curated_path
+
+
+def ingest_all() -> dict[str, str]:
+    flats = load_and_prepare_all(lazy=True)
+    return {
+        name: ingest_dataset(DATASETS[name], flat)
+        for name, flat in flats.items()
+    }
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import hashlib
+import json
+from datetime import date
+import fsspec  # type: ignore[import-untyped]
+from src.adapters.logging import get_logger
+from src.config.paths import OUT_DATA_DIR
+from src.config.settings import (
+    ETL_ENGINE,
+    ETL_INCREMENTAL,
+    EXPORT_SORT_BY,
+    EXPORT_SORT_STREAMING,
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_ROW_GROUP_SIZE,
+    PARQUET_STATISTICS,
+    SERVING_INDEX,
+)
+from src.domain.schema_registry import (
+    CATEGORICAL_DOMAINS,
+    DATASETS,
+    PARTITION_COL,
+    DatasetSpec,
+)
+
+log = get_logger()
+
+CACHE_NAME = "run_cache.json"
+
+
+def _cache_uri() -> str:
+    return f"{OUT_DATA_DIR}/{CACHE_NAME}"
+
+
+def _spec_hash(spec: DatasetSpec) -> str:
+    columns = set(spec.raw_schema) | set(spec.flat_expected_cols)
+    payload = json.dumps(
+        {
+            "kind": spec.kind,
+            "raw_path": spec.raw_path,
+            "raw_schema": {c: str(t) for c, t in spec.raw_schema.items()},
+            "flat_expected_cols": spec.flat_expected_cols,
+            "allow_new_columns": spec.allow_new_columns,
+            "date_col": spec.date_col,
+            "compact_types": {
+                c: str(t) for c, t in spec.compact_types.items()
+            },
+            "domains": {
+                c: domain.categories.to_list()
+                for c, domain in CATEGORICAL_DOMAINS.items()
+                if c in columns
+            },
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _version(info: dict) -> str:
+    version = info.get("ETag") or info.get("mtime") or info.get("LastModified")
+    return str(version)
+
+
+def _file_version(uri: str) -> dict:
+    fs, path = fsspec.core.url_to_fs(uri)
+    info = fs.info(path)
+    return {"size": info.get("size"), "version": _version(info)}
+
+
+def _dir_version(uri: str) -> dict:
+    fs, path = fsspec.core.url_to_fs(uri)
+    files = fs.find(path, detail=True) if fs.exists(path) else {}
+    listing = sorted(
+        (name, info.get("size"), _version(info))
+        for name, info in files.items()
+    )
+    digest = hashlib.sha256(json.dumps(listing).encode()).hexdigest()
+    return {"size": sum(f[1] or 0 for f in listing), "version": digest}
+
+
+def dataset_version(
+    spec: DatasetSpec, source: str, week: date | None = None
+) -> dict:
+    if source == "curated" and spec.curated_path:
+        uri = spec.curated_path
+        if week is not None:
+            uri = f"{uri}/{PARTITION_COL}={week.isoformat()}"
+        version = _dir_version(uri)
+    else:
+        version = _file_version(spec.raw_path)
+    return {**version, "spec": _spec_hash(spec)}
+
+
+def _output_settings(engine: str) -> dict:
+    return {
+        "engine": engine,
+        "incremental": ETL_INCREMENTAL,
+        "parquet_compression": PARQUET_COMPRESSION,
+        "parquet_compression_level": PARQUET_COMPRESSION_LEVEL,
+        "parquet_row_group_size": PARQUET_ROW_GROUP_SIZE,
+        "parquet_statistics": PARQUET_STATISTICS,
+        "export_sort_by": list(EXPORT_SORT_BY),
+        "export_sort_streaming": EXPORT_SORT_STREAMING,
+        "serving_index": SERVING_INDEX,
+    }
+
+
+def input_fingerprint(
+    as_of: date | None = None, source: str = "raw", engine: str = ETL_ENGINE
+) -> dict:
+    return {
+        "as_of": as_of.isoformat() if as_of else None,
+        "source": source,
+        "settings": _output_settings(engine),
+        "datasets": {
+            name: dataset_version(spec, source)
+            for name, spec in DATASETS.items()
+        },
+    }
+
+
+def _load_cached() -> dict | None:
+    fs, path = fsspec.core.url_to_fs(_cache_uri())
+    if not fs.exists(path):
+        return None
+    try:
+        with fsspec.open(_cache_uri(), "r") as f:
+            return json.load(f)
+    except ValueError as e:
+        log.warning("run_cache_unreadable", path=_cache_uri(), error=str(e))
+        return None
+
+
+def is_unchanged(fingerprint: dict) -> bool:
+    fs, path = fsspec.core.url_to_fs(f"{OUT_DATA_DIR}/final.parquet")
+    hit = fs.exists(path) and _load_cached() == fingerprint
+    log.info("run_cache_checked", hit=hit)
+    return hit
+
+
+def save_fingerprint(fingerprint: dict) -> str:
+    uri = _cache_uri()
+    with fsspec.open(uri, "w") as f:
+        json.dump(fingerprint, f, indent=2, sort_keys=True)
+    return uri
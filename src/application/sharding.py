@@ -0,0 +1,169 @@
+from __future__ import annotations
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import repeat
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters import storage
+from src.adapters.logging import get_logger
+from src.adapters.metrics import stage_span
+from src.application.transform_service import (
+    build_output,
+    export_output,
+    week_anchors,
+)
+from src.config.settings import TRANSFORM_SHARD_THREADS, TRANSFORM_SHARDS
+
+log = get_logger()
+
+SHARD_KEY = "user_id"
+SHARD_SEED = 0
+
+
+def check_engine(engine: str, shards: int, incremental: bool) -> None:
+    if shards > 1 and (incremental or engine == "streaming"):
+        raise ValueError(
+            "TRANSFORM_SHARDS > 1 does not support ETL_INCREMENTAL "
+            "or engine=streaming"
+        )
+
+
+def shard_expr(shards: int) -> pl.Expr:
+    key = pl.col(SHARD_KEY).cast(pl.Int64)
+    return key.hash(seed=SHARD_SEED) % shards
+
+
+def shard_frames(dfs: dict, shard: int, shards: int) -> dict:
+    return {
+        name: df.filter(shard_expr(shards) == shard)
+        for name, df in dfs.items()
+    }
+
+
+def split_shards(dfs: dict, shards: int) -> list[dict]:
+    out: list[dict] = [{} for _ in range(shards)]
+    for name, df in dfs.items():
+        if isinstance(df, pl.LazyFrame):
+            for shard in range(shards):
+                out[shard][name] = df.filter(shard_expr(shards) == shard)
+            continue
+        parts = df.with_columns(
+            shard_expr(shards).alias("__shard__")
+        ).partition_by("__shard__", as_dict=True, include_key=False)
+        for shard in range(shards):
+            out[shard][name] = parts.get((shard,), df.clear())
+    return out
+
+
+def resolve_anchors(
+    dfs: dict, as_of: date | None = None
+) -> dict[str, list[date]] | None:
+    return week_anchors(dfs) if as_of is None else None
+
+
+def _shard_output(
+    dfs: dict,
+    as_of: date | None,
+    features: pl.DataFrame | pl.LazyFrame | None,
+    anchors: dict[str, list[date]] | None = None,
+) -> pl.DataFrame:
+    out = build_output(dfs, as_of, features, anchors)
+    return out.collect() if isinstance(out, pl.LazyFrame) else out
+
+
+def _threads(shards: int, threads: int | None) -> int:
+    return threads or max(1, (os.cpu_count() or 1) // shards)
+
+
+def _init_worker(threads: int) -> None:
+    os.environ["POLARS_MAX_THREADS"] = str(threads)
+
+
+def sharded_output(
+    dfs: dict,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+    shards: int = TRANSFORM_SHARDS,
+    threads: int | None = TRANSFORM_SHARD_THREADS,
+) -> pl.DataFrame:
+    anchors = resolve_anchors(dfs, as_of)
+    shard_dfs = split_shards(dfs, shards)
+    shard_features = (
+        [f["features"] for f in split_shards({"features": features}, shards)]
+        if features is not None
+        else [None] * shards
+    )
+    threads = _threads(shards, threads)
+    log.info("sharded_transform_start", shards=shards, threads=threads)
+    with ProcessPoolExecutor(
+        max_workers=shards,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(threads,),
+    ) as pool:
+        outs = list(
+            pool.map(
+                _shard_output,
+                shard_dfs,
+                repeat(as_of),
+                shard_features,
+                repeat(anchors),
+            )
+        )
+    return pl.concat(outs)
+
+
+def sharded_output_and_export(
+    dfs: dict,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+    out_dir: str | None = None,
+    shards: int = TRANSFORM_SHARDS,
+) -> tuple[str, str]:
+    with stage_span("transform") as span:
+        out = sharded_output(dfs, as_of, features, shards)
+        span.output(out)
+    return export_output(out, as_of, out_dir)
+
+
+def _part_uri(parts_dir: str, shard: int) -> str:
+    return f"{parts_dir}/part-{shard:05d}.parquet"
+
+
+def export_shard(
+    dfs: dict,
+    shard: int,
+    shards: int,
+    parts_dir: str,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+) -> str:
+    uri = _part_uri(parts_dir, shard)
+    anchors = resolve_anchors(dfs, as_of)
+    if features is not None:
+        features = shard_frames({"f": features}, shard, shards)["f"]
+    with stage_span("transform_shard", dataset=str(shard)) as span:
+        out = _shard_output(
+            shard_frames(dfs, shard, shards), as_of, features, anchors
+        )
+        span.output(out)
+    fs, path = fsspec.core.url_to_fs(parts_dir)
+    fs.makedirs(path, exist_ok=True)
+    storage.write_parquet(out, uri)
+    log.info("shard_written", shard=shard, shards=shards, uri=uri)
+    return uri
+
+
+def merge_shards(
+    shards: int,
+    parts_dir: str,
+    as_of: date | None = None,
+    out_dir: str | None = None,
+) -> tuple[str, str]:
+    out = pl.concat(
+        storage.scan_parquet(_part_uri(parts_dir, shard))
+        for shard in range(shards)
+    ).collect()
+    return export_output(out, as_of, out_dir)
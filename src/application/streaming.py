@@ -0,0 +1,71 @@
+from __future__ import annotations
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters.logging import get_logger
+from src.application.weekly_store import spilled_features
+from src.config.settings import (
+    ETL_MEMORY_BUDGET_MB,
+    ETL_SOURCE,
+    ETL_SPILL_DIR,
+)
+from src.domain.schema_registry import DATASETS
+
+log = get_logger()
+
+_ROW_BYTES = 256
+_CHUNKS_IN_FLIGHT = 4
+_MIN_CHUNK_ROWS = 1_000
+
+
+def chunk_rows(budget_mb: int = ETL_MEMORY_BUDGET_MB) -> int:
+    per_row = pl.thread_pool_size() * _ROW_BYTES * _CHUNKS_IN_FLIGHT
+    return max(budget_mb * 1024**2 // per_row, _MIN_CHUNK_ROWS)
+
+
+@contextmanager
+def configure_streaming(
+    budget_mb: int = ETL_MEMORY_BUDGET_MB,
+) -> Iterator[int]:
+    rows = chunk_rows(budget_mb)
+    with pl.Config():
+        pl.Config.set_engine_affinity("streaming")
+        pl.Config.set_streaming_chunk_size(rows)
+        log.info("streaming_configured", budget_mb=budget_mb, chunk_rows=rows)
+        yield rows
+
+
+def input_bytes(source: str = ETL_SOURCE) -> int:
+    total = 0
+    for spec in DATASETS.values():
+        curated = source == "curated" and spec.curated_path
+        uri = spec.curated_path if curated else spec.raw_path
+        fs, path = fsspec.core.url_to_fs(uri)
+        if fs.exists(path):
+            total += fs.du(path)
+    return total
+
+
+@contextmanager
+def streaming_features(
+    dfs: dict,
+    as_of: date | None = None,
+    budget_mb: int = ETL_MEMORY_BUDGET_MB,
+    spill_root: str = ETL_SPILL_DIR,
+    source: str = ETL_SOURCE,
+) -> Iterator[pl.LazyFrame | None]:
+    size = input_bytes(source)
+    if size <= budget_mb * 1024**2:
+        yield None
+        return
+    spill_dir = f"{spill_root}/run-{uuid.uuid4().hex}"
+    log.info("streaming_spill", input_bytes=size, budget_mb=budget_mb)
+    fs, path = fsspec.core.url_to_fs(spill_dir)
+    try:
+        yield spilled_features(dfs, spill_dir, as_of)
+    finally:
+        if fs.exists(path):
+            fs.rm(path, recursive=True)
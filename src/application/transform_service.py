@@ -1,78 +1,345 @@
 from __future__ import annotations
-import fsspec  # type: ignore[import-untyped]
+from datetime import date, timedelta
 import polars as pl
 from src.adapters.logging import get_logger
+from src.adapters.metrics import stage_span, uri_size
+from src.adapters.serving import write_serving_index
+from src.adapters.writer import sink_outputs, write_manifest, write_outputs
 from src.config.paths import OUT_DATA_DIR
+from src.config.settings import (
+    EXPORT_SORT_BY,
+    EXPORT_SORT_STREAMING,
+    SERVING_INDEX,
+)
+from src.domain.schema_registry import PARTITION_COL, FrameT
 
 log = get_logger()
 
 
-def get_last_week(df: pl.DataFrame, column_name: str) -> pl.DataFrame:
-    return (
-        df.with_columns(
-            pl.col(column_name).dt.truncate("1w").alias("week_start")
+def _week_start(column_name: str) -> pl.Expr:
+    return pl.col(column_name).dt.truncate("1w")
+
+
+def week_of(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _week_expr(df: pl.DataFrame | pl.LazyFrame, column_name: str) -> pl.Expr:
+    if PARTITION_COL in df.collect_schema().names():
+        return pl.col(PARTITION_COL)
+    return _week_start(column_name)
+
+
+def latest_weeks(
+    df: pl.DataFrame | pl.LazyFrame, column_name: str, n: int
+) -> list[date]:
+    weeks = df.select(
+        _week_expr(df, column_name).unique().drop_nulls().sort().tail(n)
+    )
+    if isinstance(weeks, pl.LazyFrame):
+        weeks = weeks.collect()
+    return weeks.to_series().to_list()
+
+
+DATE_COLS = {"prints": "day", "taps": "day", "pays": "pay_date"}
+ANCHOR_WEEKS = 4
+
+
+def week_anchors(dfs: dict) -> dict[str, list[date]]:
+    queries = {
+        name: dfs[name].select(
+            _week_expr(dfs[name], col)
+            .unique()
+            .drop_nulls()
+            .sort()
+            .tail(ANCHOR_WEEKS)
         )
-        .filter(pl.col("week_start") == pl.col("week_start").max())
-        .drop("week_start")
+        for name, col in DATE_COLS.items()
+        if name in dfs
+    }
+    lazy = [n for n, q in queries.items() if isinstance(q, pl.LazyFrame)]
+    if lazy:
+        collected = pl.collect_all([queries[n] for n in lazy])
+        queries.update(zip(lazy, collected))
+    return {n: q.to_series().to_list() for n, q in queries.items()}
+
+
+def _filter_weeks(df: FrameT, column_name: str, weeks: list[date]) -> FrameT:
+    if not weeks:
+        return df.clear()
+    return df.filter(
+        _week_expr(df, column_name).is_between(weeks[0], weeks[-1])
     )
 
 
-def get_last_weeks(df: pl.DataFrame, column_name: str) -> pl.DataFrame:
-    return (
-        df.with_columns(
-            pl.col(column_name).dt.truncate("1w").alias("week_start")
+def between_dates(
+    df: FrameT, column_name: str, first: date, last: date
+) -> FrameT:
+    predicate = pl.col(column_name).is_between(first, last)
+    if PARTITION_COL in df.collect_schema().names():
+        predicate = predicate & pl.col(PARTITION_COL).is_between(
+            week_of(first), last
+        )
+    return df.filter(predicate)
+
+
+def window_bounds(as_of: date) -> tuple[date, date]:
+    return week_of(as_of) - timedelta(weeks=3), as_of
+
+
+def get_last_week(
+    df: FrameT,
+    column_name: str,
+    as_of: date | None = None,
+    anchors: list[date] | None = None,
+) -> FrameT:
+    if as_of is not None:
+        return between_dates(df, column_name, week_of(as_of), as_of)
+    if anchors is None:
+        anchors = latest_weeks(df, column_name, 1)
+    return _filter_weeks(df, column_name, anchors[-1:])
+
+
+def get_last_weeks(
+    df: FrameT,
+    column_name: str,
+    as_of: date | None = None,
+    anchors: list[date] | None = None,
+) -> FrameT:
+    if as_of is not None:
+        first, _ = window_bounds(as_of)
+        last = week_of(as_of) - timedelta(days=1)
+        return between_dates(df, column_name, first, last)
+    if anchors is None:
+        anchors = latest_weeks(df, column_name, ANCHOR_WEEKS)
+    return _filter_weeks(df, column_name, anchors[:3])
+
+
+KEYS = ["user_id", "value_prop"]
+COUNT_COLS = ["cantidad_vistas", "cantidad_taps", "cantidad_pagos"]
+COUNT_DTYPE = pl.UInt32
+FEATURE_COLS = [
+    "cantidad_vistas",
+    "cantidad_taps",
+    "hizo_click",
+    "cantidad_pagos",
+    "total_pagos",
+]
+_PRINTS, _TAPS, _PAYS = 0, 1, 2
+
+
+def _tagged(
+    df: FrameT, source: int, amount: pl.Expr, week_col: str | None = None
+) -> FrameT:
+    by = [_week_start(week_col).alias("week_start")] if week_col else []
+    return df.select(
+        *by,
+        *KEYS,
+        pl.lit(source, pl.UInt8).alias("source"),
+        amount.cast(pl.Float64).alias("amount"),
+    )
+
+
+def _source_aggs(views: str, taps: str, pays: str, total: str) -> list:
+    source = pl.col("source")
+    return [
+        (source == _PRINTS).sum().cast(COUNT_DTYPE).alias(views),
+        (source == _TAPS).sum().cast(COUNT_DTYPE).alias(taps),
+        (source == _PAYS).sum().cast(COUNT_DTYPE).alias(pays),
+        pl.col("amount").filter(source == _PAYS).sum().alias(total),
+    ]
+
+
+def build_features(
+    dfs: dict,
+    as_of: date | None = None,
+    anchors: dict[str, list[date]] | None = None,
+) -> pl.DataFrame | pl.LazyFrame:
+    if as_of is None and anchors is None:
+        anchors = week_anchors(dfs)
+
+    def window(name: str):
+        return get_last_weeks(
+            dfs[name],
+            DATE_COLS[name],
+            as_of,
+            anchors[name] if anchors is not None else None,
         )
-        .filter(
-            pl.col("week_start").is_in(
-                pl.col("week_start").unique().sort().tail(4).head(3).implode()
+
+    long = pl.concat(
+        [
+            _tagged(window("prints"), _PRINTS, pl.lit(0.0)),
+            _tagged(window("taps"), _TAPS, pl.lit(0.0)),
+            _tagged(window("pays"), _PAYS, pl.col("total")),
+        ],
+        how="vertical_relaxed",
+    )
+    return (
+        long.group_by(KEYS)
+        .agg(
+            *_source_aggs(
+                "cantidad_vistas",
+                "cantidad_taps",
+                "cantidad_pagos",
+                "total_pagos",
             )
         )
-        .drop("week_start")
+        .with_columns(pl.col("total_pagos").cast(pl.Int64))
     )
 
 
-def build_output_and_export(dfs: dict) -> tuple[str, str]:
+def weekly_aggregates(
+    dfs: dict, weeks: list[date]
+) -> pl.DataFrame | pl.LazyFrame:
     pays, taps, prints = dfs["pays"], dfs["taps"], dfs["prints"]
-    out = get_last_week(prints, "day")
-    counts = (
-        get_last_weeks(prints, "day")
-        .group_by(["user_id", "value_prop"])
-        .agg(pl.len().cast(pl.Int64).alias("cantidad_vistas"))
+    first, last = min(weeks), max(weeks) + timedelta(days=6)
+
+    def window(df: FrameT, column_name: str) -> FrameT:
+        return between_dates(df, column_name, first, last)
+
+    long = pl.concat(
+        [
+            _tagged(window(prints, "day"), _PRINTS, pl.lit(0.0), "day"),
+            _tagged(window(taps, "day"), _TAPS, pl.lit(0.0), "day"),
+            _tagged(
+                window(pays, "pay_date"), _PAYS, pl.col("total"), "pay_date"
+            ),
+        ],
+        how="vertical_relaxed",
+    )
+    return (
+        long.filter(pl.col("week_start").is_in(weeks))
+        .group_by(["week_start", *KEYS])
+        .agg(*_source_aggs("views", "taps", "pays", "total"))
+    )
+
+
+def build_output(
+    dfs: dict,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+    anchors: dict[str, list[date]] | None = None,
+) -> pl.DataFrame | pl.LazyFrame:
+    if as_of is None and anchors is None:
+        anchors = week_anchors(
+            dfs if features is None else {"prints": dfs["prints"]}
+        )
+    out = get_last_week(
+        dfs["prints"],
+        "day",
+        as_of,
+        anchors["prints"] if anchors is not None else None,
     )
-    out = out.join(
-        counts, on=["user_id", "value_prop"], how="left"
-    ).with_columns(pl.col("cantidad_vistas").fill_null(0).cast(pl.Int64))
-    counts = (
-        get_last_weeks(taps, "day")
-        .group_by(["user_id", "value_prop"])
-        .agg(pl.len().cast(pl.Int64).alias("cantidad_taps"))
+    base_cols = [c for c in out.collect_schema().names() if c != PARTITION_COL]
+    if features is None:
+        features = build_features(dfs, as_of, anchors)
+    if isinstance(out, pl.LazyFrame):
+        features = features.lazy()
+    elif isinstance(features, pl.LazyFrame):
+        features = features.collect()
+    return join_features(out, features).select(*base_cols, *FEATURE_COLS)
+
+
+def join_features(out: FrameT, features: FrameT, on: list = KEYS) -> FrameT:
+    key_types = out.collect_schema()
+    features = features.with_columns(
+        pl.col(k).cast(key_types[k]) for k in on
     )
-    out = (
-        out.join(counts, on=["user_id", "value_prop"], how="left")
-        .with_columns(pl.col("cantidad_taps").fill_null(0).cast(pl.Int64))
+    return (
+        out.join(features, on=on, how="left")
+        .with_columns(pl.col([*COUNT_COLS, "total_pagos"]).fill_null(0))
         .with_columns((pl.col("cantidad_taps") > 0).alias("hizo_click"))
     )
-    counts = (
-        get_last_weeks(pays, "pay_date")
-        .group_by(["user_id", "value_prop"])
-        .agg(pl.len().cast(pl.Int64).alias("cantidad_pagos"))
+
+
+def _export_paths(out_dir: str | None = None) -> tuple[str, str]:
+    base = out_dir or OUT_DATA_DIR
+    return f"{base}/final.csv", f"{base}/final.parquet"
+
+
+def _sort_keys(out: pl.DataFrame | pl.LazyFrame) -> tuple[str, ...]:
+    names = out.collect_schema().names()
+    return tuple(c for c in EXPORT_SORT_BY if c in names)
+
+
+def _sorted(out: FrameT) -> FrameT:
+    schema = out.collect_schema()
+    by = [
+        (
+            pl.col(c).cast(pl.Utf8)
+            if isinstance(schema[c], (pl.Enum, pl.Categorical))
+            else pl.col(c)
+        )
+        for c in _sort_keys(out)
+    ]
+    return out.sort(by, maintain_order=True) if by else out
+
+
+def _written(*uris: str) -> int | None:
+    sizes = [uri_size(u) for u in uris]
+    return None if None in sizes else sum(s or 0 for s in sizes)
+
+
+def build_output_and_export(
+    dfs: dict,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+    out_dir: str | None = None,
+) -> tuple[str, str]:
+    rows_in = sum(
+        df.height for df in dfs.values() if isinstance(df, pl.DataFrame)
+    )
+    with stage_span("transform", rows_in=rows_in or None) as span:
+        out = build_output(dfs, as_of, features)
+        if isinstance(out, pl.LazyFrame):
+            out = out.collect()
+        span.output(out)
+    return export_output(out, as_of, out_dir)
+
+
+def export_output(
+    out: pl.DataFrame, as_of: date | None = None, out_dir: str | None = None
+) -> tuple[str, str]:
+    csv_path, pq_path = _export_paths(out_dir)
+    with stage_span("export", rows_in=out.height) as span:
+        out = _sorted(out)
+        write_outputs(out, csv_path, pq_path)
+        write_manifest(pq_path, _sort_keys(out), frame=out)
+        span.bytes_written = _written(csv_path, pq_path)
+    if SERVING_INDEX:
+        with stage_span("serving_index", rows_in=out.height):
+            write_serving_index(out, str(out_dir or OUT_DATA_DIR))
+    log.info(
+        "export_done",
+        rows=out.height,
+        csv=csv_path,
+        parquet=pq_path,
+        as_of=as_of.isoformat() if as_of else None,
     )
-    out = out.join(
-        counts, on=["user_id", "value_prop"], how="left"
-    ).with_columns(pl.col("cantidad_pagos").fill_null(0).cast(pl.Int64))
-    counts = (
-        get_last_weeks(pays, "pay_date")
-        .group_by(["user_id", "value_prop"])
-        .agg(pl.sum("total").cast(pl.Int64).alias("total_pagos"))
+    return csv_path, pq_path
+
+
+def stream_output_and_export(
+    dfs: dict,
+    as_of: date | None = None,
+    features: pl.DataFrame | pl.LazyFrame | None = None,
+    out_dir: str | None = None,
+) -> tuple[str, str]:
+    out = build_output(dfs, as_of, features).lazy()
+    sort_by = _sort_keys(out) if EXPORT_SORT_STREAMING else ()
+    if sort_by:
+        out = _sorted(out)
+    csv_path, pq_path = _export_paths(out_dir)
+    with stage_span("transform_export") as span:
+        sink_outputs(out, csv_path, pq_path)
+        write_manifest(pq_path, sort_by)
+        span.bytes_written = _written(csv_path, pq_path)
+    log.info(
+        "export_done",
+        rows=None,
+        csv=csv_path,
+        parquet=pq_path,
+        as_of=as_of.isoformat() if as_of else None,
+        engine="streaming",
     )
-    out = out.join(
-        counts, on=["user_id", "value_prop"], how="left"
-    ).with_columns(pl.col("total_pagos").fill_null(0).cast(pl.Int64))
-    csv_path = f"{OUT_DATA_DIR}/final.csv"
-    pq_path = f"{OUT_DATA_DIR}/final.parquet"
-    with fsspec.open(csv_path, "wb") as f:
-        out.write_csv(f)
-    with fsspec.open(pq_path, "wb") as f:
-        out.write_parquet(f)
-    log.info("export_done", rows=out.height, csv=csv_path, parquet=pq_path)
     return csv_path, pq_path
@@ -7,7 +7,9 @@ from typing import Any, Mapping
 import polars as pl
 from polars.datatypes import DataType, DataTypeClass
 import fsspec  # type: ignore[import-untyped]
+from src.adapters import storage
 from src.adapters.logging import get_logger
+from src.adapters.reports import write_report
 from src.domain.schema_registry import DatasetSpec
 
 log = get_logger()
@@ -82,26 +84,19 @@ def _is_date_like(x: Any) -> bool:
     return False
 
 
-def _write_text(path: str, text: str) -> str:
-    with fsspec.open(path, "w") as f:
-        f.write(text)
-    return path
-
-
 def _write_report(dataset: str, stage: str, payload: dict) -> str:
     dir_base = f"{REPORT_BASE}/{dataset}"
     filename = f"schema_{stage}.json"
-    full = f"{dir_base}/{filename}"
-    return _write_text(full, json.dumps(payload, ensure_ascii=False, indent=2))
+    return write_report(f"{dir_base}/{filename}", payload)
 
 
 def _csv_columns(uri: str) -> list[str]:
-    return pl.read_csv(uri, n_rows=0).columns
+    return storage.read_csv(uri, n_rows=0).columns
 
 
 def _csv_rowcount(uri: str) -> int:
     return int(
-        pl.scan_csv(uri, infer_schema_length=0)
+        storage.scan_csv(uri, infer_schema_length=0)
         .select(pl.len())
         .collect()
         .item()
@@ -114,58 +109,195 @@ def _resolve_temporal_dtype(
     return pl.Date if t == pl.Date else pl.Datetime
 
 
+_INT_TYPES = (
+    pl.Int8,
+    pl.Int16,
+    pl.Int32,
+    pl.Int64,
+    pl.UInt8,
+    pl.UInt16,
+    pl.UInt32,
+    pl.UInt64,
+)
+_FLOAT_TYPES = (pl.Float32, pl.Float64)
+_TEMPORAL_TYPES = (pl.Date, pl.Datetime)
+
+
+def _is_checked(t: PolarsDType) -> bool:
+    return (
+        t in _INT_TYPES
+        or t in _FLOAT_TYPES
+        or t in _TEMPORAL_TYPES
+        or t == pl.Boolean
+    )
+
+
+def _invalid_expr(col: str, t: PolarsDType) -> pl.Expr:
+    s = pl.col(col)
+    if t in _INT_TYPES:
+        invalid = (
+            ~s.str.contains(_INT_RE.pattern, literal=False)
+        ) & s.is_not_null()
+    elif t in _FLOAT_TYPES:
+        invalid = (
+            ~s.str.contains(_FLOAT_RE.pattern, literal=False)
+        ) & s.is_not_null()
+    elif t == pl.Boolean:
+        invalid = (
+            ~s.str.to_lowercase().is_in(
+                ["true", "false", "1", "0", "t", "f", "yes", "no"]
+            )
+        ) & s.is_not_null()
+    elif t in _TEMPORAL_TYPES:
+        invalid = (
+            s.str.strptime(_resolve_temporal_dtype(t), strict=False).is_null()
+            & s.is_not_null()
+        )
+    else:
+        invalid = pl.lit(False)
+    return invalid.cast(pl.Int64).sum().alias(col)
+
+
+_OVERFLOW = "__overflow__"
+_INT_BOUNDS = (
+    (pl.Int8, -(2**7), 2**7 - 1),
+    (pl.Int16, -(2**15), 2**15 - 1),
+    (pl.Int32, -(2**31), 2**31 - 1),
+    (pl.Int64, -(2**63), 2**63 - 1),
+    (pl.UInt8, 0, 2**8 - 1),
+    (pl.UInt16, 0, 2**16 - 1),
+    (pl.UInt32, 0, 2**32 - 1),
+    (pl.UInt64, 0, 2**63 - 1),
+)
+
+
+def _int_bounds(t: PolarsDType) -> tuple[int, int]:
+    for dtype, lo, hi in _INT_BOUNDS:
+        if t == dtype:
+            return lo, hi
+    raise ValueError(f"{t} is not an integer type")
+
+
+def _compact_source(
+    schema: Mapping[str, PolarsDType], col: str
+) -> pl.Expr | None:
+    if col in schema:
+        return pl.col(col)
+    for name, t in schema.items():
+        if isinstance(t, pl.Struct) and col in {f.name for f in t.fields}:
+            return pl.col(name).struct.field(col)
+    return None
+
+
+def _overflow_exprs(
+    schema: Mapping[str, PolarsDType],
+    compact: Mapping[str, PolarsDType] | None,
+) -> list[pl.Expr]:
+    exprs = []
+    for col, t in (compact or {}).items():
+        src = _compact_source(schema, col)
+        if src is None:
+            continue
+        v = src.cast(pl.Int64, strict=False)
+        out_of_range = v.is_not_null() & ~v.is_between(*_int_bounds(t))
+        exprs.append(out_of_range.cast(pl.Int64).sum().alias(col + _OVERFLOW))
+    return exprs
+
+
+def _split_overflow(counts: Mapping[str, int]) -> tuple[dict, dict]:
+    invalid = {k: v for k, v in counts.items() if not k.endswith(_OVERFLOW)}
+    overflow = {
+        k.removesuffix(_OVERFLOW): v
+        for k, v in counts.items()
+        if k.endswith(_OVERFLOW) and v > 0
+    }
+    return invalid, overflow
+
+
 def _invalid_token_counts_csv(
-    uri: str, expected: Mapping[str, PolarsDType]
+    uri: str,
+    expected: Mapping[str, PolarsDType],
+    compact: Mapping[str, PolarsDType] | None = None,
 ) -> dict[str, int]:
     present = set(_csv_columns(uri))
     cols = [c for c in expected.keys() if c in present]
     if not cols:
         return {}
-    lf = pl.scan_csv(
+    schema = {c: pl.Utf8 for c in cols}
+    lf = storage.scan_csv(
         uri,
-        schema_overrides={c: pl.Utf8 for c in cols},
+        schema_overrides=schema,
         infer_schema_length=0,
         ignore_errors=True,
     )
-    exprs = []
-    for col in cols:
-        t = expected[col]
-        s = pl.col(col)
-        if t in (
-            pl.Int8,
-            pl.Int16,
-            pl.Int32,
-            pl.Int64,
-            pl.UInt8,
-            pl.UInt16,
-            pl.UInt32,
-            pl.UInt64,
-        ):
-            invalid = (
-                ~s.str.contains(_INT_RE.pattern, literal=False)
-            ) & s.is_not_null()
-        elif t in (pl.Float32, pl.Float64):
-            invalid = (
-                ~s.str.contains(_FLOAT_RE.pattern, literal=False)
-            ) & s.is_not_null()
-        elif t == pl.Boolean:
-            invalid = (
-                ~s.str.to_lowercase().is_in(
-                    ["true", "false", "1", "0", "t", "f", "yes", "no"]
-                )
-            ) & s.is_not_null()
-        elif t in (pl.Date, pl.Datetime):
-            invalid = (
-                s.str.strptime(
-                    _resolve_temporal_dtype(t), strict=False
-                ).is_null()
-                & s.is_not_null()
-            )
-        else:
-            invalid = pl.lit(False)
-        exprs.append(invalid.cast(pl.Int64).sum().alias(col))
+    exprs = [_invalid_expr(col, expected[col]) for col in cols]
+    exprs += _overflow_exprs(schema, compact)
     out = lf.select(exprs).collect().to_dicts()[0]
-    return {k: int(out.get(k) or 0) for k in cols}
+    return {k: int(v or 0) for k, v in out.items()}
+
+
+_NDJSON_INFER_ROWS = 10_000
+_SEEN = "__seen__"
+
+
+def _ndjson_schema(
+    uri: str, expected: Mapping[str, PolarsDType], typed: bool = False
+) -> tuple[dict[str, PolarsDType], set[str]]:
+    inferred = storage.scan_ndjson(
+        uri, infer_schema_length=_NDJSON_INFER_ROWS
+    ).collect_schema()
+    schema: dict[str, PolarsDType] = {} if typed else dict(inferred)
+    for c, t in expected.items():
+        if _is_checked(t):
+            schema[c] = pl.Utf8
+        elif typed or c not in schema:
+            schema[c] = t
+    return schema, set(inferred.names())
+
+
+def _seen_exprs(
+    expected: Mapping[str, PolarsDType], inferred: set[str]
+) -> list[pl.Expr]:
+    return [
+        pl.col(c).is_not_null().any().alias(c + _SEEN)
+        for c in expected
+        if c not in inferred
+    ]
+
+
+def _split_seen(
+    row: Mapping[str, Any], inferred: set[str]
+) -> tuple[set[str], dict[str, Any]]:
+    seen = {
+        k.removesuffix(_SEEN)
+        for k, v in row.items()
+        if k.endswith(_SEEN) and v
+    }
+    rest = {k: v for k, v in row.items() if not k.endswith(_SEEN)}
+    return inferred | seen, rest
+
+
+def _ndjson_profile(
+    uri: str,
+    expected: Mapping[str, PolarsDType],
+    compact: Mapping[str, PolarsDType] | None = None,
+) -> tuple[set[str], int, dict[str, int]]:
+    schema, inferred = _ndjson_schema(uri, expected)
+    checks = [c for c, t in expected.items() if _is_checked(t)]
+    lf = storage.scan_ndjson(uri, schema=schema)
+    exprs = [pl.len().alias("__rows__")] + [
+        _invalid_expr(col, expected[col]) for col in checks
+    ]
+    exprs += _overflow_exprs(schema, compact)
+    exprs += _seen_exprs(expected, inferred)
+    row = lf.select(exprs).collect().to_dicts()[0]
+    present, out = _split_seen(row, inferred)
+    invalid = {k: int(v or 0) for k, v in out.items() if k != "__rows__"}
+    return (
+        present,
+        int(out["__rows__"]),
+        {k: v for k, v in invalid.items() if v > 0},
+    )
 
 
 def _ndjson_keys_and_rowcount(
@@ -189,15 +321,35 @@ def _ndjson_keys_and_rowcount(
     return keys, n
 
 
+def _compact_value(obj: dict, col: str) -> Any:
+    if col in obj:
+        return obj[col]
+    for v in obj.values():
+        if isinstance(v, dict) and col in v:
+            return v[col]
+    return None
+
+
+def _overflows(v: Any, t: PolarsDType) -> bool:
+    if v is None or isinstance(v, bool) or not _is_int_like(v):
+        return False
+    lo, hi = _int_bounds(t)
+    return not lo <= int(v) <= hi
+
+
 def _invalid_token_counts_ndjson(
-    uri: str, expected: Mapping[str, PolarsDType]
+    uri: str,
+    expected: Mapping[str, PolarsDType],
+    compact: Mapping[str, PolarsDType] | None = None,
 ) -> dict[str, int]:
     checks = {
         k: v for k, v in expected.items() if not isinstance(v, pl.Struct)
     }
-    if not checks:
+    compact = compact or {}
+    if not checks and not compact:
         return {}
     counts = {k: 0 for k in checks.keys()}
+    counts.update({c + _OVERFLOW: 0 for c in compact})
     with fsspec.open(uri, "r") as f:
         for line in f:
             s = line.strip()
@@ -210,6 +362,9 @@ def _invalid_token_counts_ndjson(
                 continue
             if not isinstance(obj, dict):
                 continue
+            for col, t in compact.items():
+                if _overflows(_compact_value(obj, col), t):
+                    counts[col + _OVERFLOW] += 1
             for col, t in checks.items():
                 if col not in obj or obj[col] is None:
                     continue
@@ -237,119 +392,45 @@ def _invalid_token_counts_ndjson(
     return {k: v for k, v in counts.items() if v > 0}
 
 
-def validate_raw_schema_pays(
-    spec: DatasetSpec, df: pl.DataFrame | None = None, strict: bool = True
-) -> tuple[bool, str]:
-    try:
-        present = set(_csv_columns(spec.raw_path))
-        rowcount = (
-            df.height if df is not None else _csv_rowcount(spec.raw_path)
-        )
-        invalid_tokens = _invalid_token_counts_csv(
-            spec.raw_path, spec.raw_schema
-        )
-    except Exception as e:
-        rp = _write_report(
-            spec.name,
-            "raw",
-            {
-                "dataset": spec.name,
-                "stage": "raw",
-                "rows": 0,
-                "missing_columns": [],
-                "new_columns": [],
-                "wrong_types": [],
-                "expected_schema": {
-                    k: str(v) for k, v in spec.raw_schema.items()
-                },
-                "source_columns": [],
-                "read_error": str(e),
-                "ok": False,
-            },
-        )
-        log.error("raw_read_error", dataset=spec.name, report=rp, error=str(e))
-        return False, rp
-    exp_cols = set(spec.raw_schema.keys())
-    missing = sorted(list(exp_cols - present))
-    new_cols = sorted(list(present - exp_cols))
-    wrong_types = [
-        {"column": c, "expected": str(spec.raw_schema[c])}
-        for c, n in sorted(invalid_tokens.items())
-        if n > 0
-    ]
-    ok = (
-        (not missing)
-        and (not wrong_types)
-        and (spec.allow_new_columns or not new_cols)
-    )
+def _read_error_report(spec: DatasetSpec, e: Exception) -> str:
     rp = _write_report(
         spec.name,
         "raw",
         {
             "dataset": spec.name,
             "stage": "raw",
-            "rows": int(rowcount),
-            "missing_columns": missing,
-            "new_columns": new_cols,
-            "wrong_types": wrong_types,
-            "expected_schema": {k: str(v) for k, v in spec.raw_schema.items()},
-            "source_columns": sorted(list(present)),
-            "ok": ok,
+            "rows": 0,
+            "missing_columns": [],
+            "new_columns": [],
+            "wrong_types": [],
+            "expected_schema": {
+                k: str(v) for k, v in spec.raw_schema.items()
+            },
+            "source_columns": [],
+            "read_error": str(e),
+            "ok": False,
         },
     )
-    if missing or wrong_types:
-        log.error(
-            "raw_schema_error",
-            dataset=spec.name,
-            missing=missing,
-            wrong_types=wrong_types,
-            new_columns=new_cols,
-            report=rp,
-        )
-        if strict:
-            return False, rp
-    if new_cols and not spec.allow_new_columns and strict:
-        log.error(
-            "raw_schema_new_cols_error",
-            dataset=spec.name,
-            new=new_cols,
-            report=rp,
-        )
-        return False, rp
-    log.info("raw_schema_ok", dataset=spec.name, report=rp)
-    return True, rp
+    log.error("raw_read_error", dataset=spec.name, report=rp, error=str(e))
+    return rp
 
 
-def validate_raw_schema_events(
-    spec: DatasetSpec, df: pl.DataFrame | None = None, strict: bool = True
+def _raw_schema_report(
+    spec: DatasetSpec,
+    present: set[str],
+    rowcount: int,
+    invalid_tokens: Mapping[str, int],
+    strict: bool,
 ) -> tuple[bool, str]:
-    try:
-        keys, rowcount = _ndjson_keys_and_rowcount(spec.raw_path)
-        present = set(keys)
-        invalid_tokens = _invalid_token_counts_ndjson(
-            spec.raw_path, spec.raw_schema
-        )
-    except Exception as e:
-        rp = _write_report(
-            spec.name,
-            "raw",
-            {
-                "dataset": spec.name,
-                "stage": "raw",
-                "rows": 0,
-                "missing_columns": [],
-                "new_columns": [],
-                "wrong_types": [],
-                "expected_schema": {
-                    k: str(v) for k, v in spec.raw_schema.items()
-                },
-                "source_columns": [],
-                "read_error": str(e),
-                "ok": False,
-            },
-        )
-        log.error("raw_read_error", dataset=spec.name, report=rp, error=str(e))
-        return False, rp
+    invalid_tokens, overflow_counts = _split_overflow(invalid_tokens)
+    overflow = [
+        {
+            "column": c,
+            "compact_type": str(spec.compact_types[c]),
+            "rows": n,
+        }
+        for c, n in sorted(overflow_counts.items())
+    ]
     exp_cols = set(spec.raw_schema.keys())
     missing = sorted(list(exp_cols - present))
     new_cols = sorted(list(present - exp_cols))
@@ -361,6 +442,7 @@ def validate_raw_schema_events(
     ok = (
         (not missing)
         and (not wrong_types)
+        and (not overflow)
         and (spec.allow_new_columns or not new_cols)
     )
     rp = _write_report(
@@ -373,17 +455,19 @@ def validate_raw_schema_events(
             "missing_columns": missing,
             "new_columns": new_cols,
             "wrong_types": wrong_types,
+            "overflow": overflow,
             "expected_schema": {k: str(v) for k, v in spec.raw_schema.items()},
             "source_columns": sorted(list(present)),
             "ok": ok,
         },
     )
-    if missing or wrong_types:
+    if missing or wrong_types or overflow:
         log.error(
             "raw_schema_error",
             dataset=spec.name,
             missing=missing,
             wrong_types=wrong_types,
+            overflow=overflow,
             new_columns=new_cols,
             report=rp,
         )
@@ -401,6 +485,122 @@ def validate_raw_schema_events(
     return True, rp
 
 
+def validate_raw_schema_pays(
+    spec: DatasetSpec, df: pl.DataFrame | None = None, strict: bool = True
+) -> tuple[bool, str]:
+    try:
+        present = set(_csv_columns(spec.raw_path))
+        rowcount = (
+            df.height if df is not None else _csv_rowcount(spec.raw_path)
+        )
+        invalid_tokens = _invalid_token_counts_csv(
+            spec.raw_path, spec.raw_schema, spec.compact_types
+        )
+    except Exception as e:
+        return False, _read_error_report(spec, e)
+    return _raw_schema_report(spec, present, rowcount, invalid_tokens, strict)
+
+
+def validate_raw_schema_events(
+    spec: DatasetSpec, df: pl.DataFrame | None = None, strict: bool = True
+) -> tuple[bool, str]:
+    try:
+        try:
+            present, rowcount, invalid_tokens = _ndjson_profile(
+                spec.raw_path, spec.raw_schema, spec.compact_types
+            )
+        except pl.exceptions.ComputeError as e:
+            log.warning(
+                "ndjson_profile_fallback", dataset=spec.name, error=str(e)
+            )
+            keys, rowcount = _ndjson_keys_and_rowcount(spec.raw_path)
+            present = set(keys)
+            invalid_tokens = _invalid_token_counts_ndjson(
+                spec.raw_path, spec.raw_schema, spec.compact_types
+            )
+    except Exception as e:
+        return False, _read_error_report(spec, e)
+    return _raw_schema_report(spec, present, rowcount, invalid_tokens, strict)
+
+
+def _typed_expr(col: str, t: PolarsDType) -> pl.Expr:
+    s = pl.col(col)
+    if not _is_checked(t):
+        return s
+    if t in _TEMPORAL_TYPES:
+        return s.str.strptime(_resolve_temporal_dtype(t), strict=False)
+    if t == pl.Boolean:
+        return (
+            pl.when(s.is_null())
+            .then(None)
+            .otherwise(s.str.to_lowercase().is_in(["true", "1", "t", "yes"]))
+            .alias(col)
+        )
+    return s.cast(t, strict=False)
+
+
+def _validated_scan(
+    spec: DatasetSpec,
+) -> tuple[pl.LazyFrame, set[str], list[pl.Expr]]:
+    if spec.kind == "pays":
+        present = set(_csv_columns(spec.raw_path))
+        checks = [
+            c
+            for c, t in spec.raw_schema.items()
+            if c in present and _is_checked(t)
+        ]
+        lf = storage.scan_csv(
+            spec.raw_path,
+            schema_overrides={c: pl.Utf8 for c in checks},
+            infer_schema_length=0,
+        )
+        return lf, present, []
+    if spec.kind == "events":
+        schema, present = _ndjson_schema(
+            spec.raw_path, spec.raw_schema, typed=True
+        )
+        lf = storage.scan_ndjson(spec.raw_path, schema=schema)
+        return lf, present, _seen_exprs(spec.raw_schema, present)
+    raise ValueError(spec.kind)
+
+
+def read_validated(
+    spec: DatasetSpec, strict: bool = True
+) -> tuple[pl.DataFrame | None, bool, str]:
+    try:
+        lf, inferred, seen = _validated_scan(spec)
+        schema = lf.collect_schema()
+        cols = [c for c in spec.raw_schema if c in schema]
+        checks = [c for c in cols if _is_checked(spec.raw_schema[c])]
+        stats_plan = lf.select(
+            pl.len().alias("__rows__"),
+            *[_invalid_expr(c, spec.raw_schema[c]) for c in checks],
+            *_overflow_exprs(schema, spec.compact_types),
+            *seen,
+        )
+        data_plan = lf.select(
+            [_typed_expr(c, spec.raw_schema[c]) for c in cols]
+        )
+        stats, df = pl.collect_all([stats_plan, data_plan])
+    except Exception as e:
+        return None, False, _read_error_report(spec, e)
+    present, row = _split_seen(stats.to_dicts()[0], inferred)
+    df = df.select([c for c in cols if c in present])
+    invalid_tokens = {
+        c: int(v or 0) for c, v in row.items() if c != "__rows__"
+    }
+    ok, rp = _raw_schema_report(
+        spec, present, int(row["__rows__"]), invalid_tokens, strict
+    )
+    log.info(
+        "read_validated_ok" if ok else "read_validated_failed",
+        dataset=spec.name,
+        rows=df.height,
+        cols=list(df.columns),
+    )
+    return (df if ok else None), ok, rp
+
+
 def validate_flat_columns(
     spec: DatasetSpec, df_flat: pl.DataFrame, strict: bool = True
 ) -> tuple[bool, str]:
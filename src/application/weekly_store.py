@@ -0,0 +1,251 @@
+from __future__ import annotations
+from datetime import date, timedelta
+import hashlib
+import json
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters import storage
+from src.adapters.logging import get_logger
+from src.adapters.metrics import stage_span
+from src.adapters.storage import storage_options
+from src.adapters.writer import PARQUET_OPTIONS
+from src.application.transform_service import (
+    COUNT_DTYPE,
+    FEATURE_COLS,
+    KEYS,
+    between_dates,
+    join_features,
+    week_anchors,
+    week_of,
+    weekly_aggregates,
+)
+from src.application.run_cache import dataset_version
+from src.config.paths import OUT_DATA_DIR
+from src.config.settings import ETL_SOURCE
+from src.domain.schema_registry import DATASETS, PARTITION_COL, FrameT
+
+log = get_logger()
+
+STORE_NAME = "weekly_aggregates"
+BACKFILL_NAME = "backfill"
+HISTORY_WEEKS = 3
+SOURCE_COLS = {
+    "prints": ["views"],
+    "taps": ["taps"],
+    "pays": ["pays", "total"],
+}
+
+
+def _partition_uri(week: date) -> str:
+    return (
+        f"{OUT_DATA_DIR}/{STORE_NAME}/"
+        f"week_start={week.isoformat()}/part-0.parquet"
+    )
+
+
+def _digest_uri(week: date) -> str:
+    return _partition_uri(week).rsplit("/", 1)[0] + "/_input_digest"
+
+
+def _read_week(week: date, digest: str) -> pl.DataFrame | None:
+    uri = _partition_uri(week)
+    fs, path = fsspec.core.url_to_fs(uri)
+    if not fs.exists(path):
+        return None
+    fs, path = fsspec.core.url_to_fs(_digest_uri(week))
+    stored = fs.cat_file(path).decode() if fs.exists(path) else None
+    if stored != digest:
+        log.info("weekly_store_stale", week=week.isoformat())
+        return None
+    return storage.read_parquet(uri)
+
+
+def _write_week(week: date, agg: pl.DataFrame, digest: str) -> str:
+    uri = _partition_uri(week)
+    fs, path = fsspec.core.url_to_fs(uri)
+    fs.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+    written = storage.write_parquet(agg, uri)
+    with fsspec.open(_digest_uri(week), "w") as f:
+        f.write(digest)
+    return written
+
+
+def week_digest(week: date, source: str = ETL_SOURCE) -> str:
+    versions = {
+        name: dataset_version(spec, source, week)
+        for name, spec in DATASETS.items()
+    }
+    return hashlib.sha256(
+        json.dumps(versions, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def history_weeks(target: date) -> list[date]:
+    return [
+        target - timedelta(weeks=n) for n in range(HISTORY_WEEKS, 0, -1)
+    ]
+
+
+def load_history(
+    dfs: dict, weeks: list[date], source: str = ETL_SOURCE
+) -> pl.DataFrame:
+    digests = {week: week_digest(week, source) for week in weeks}
+    parts: list[pl.DataFrame] = []
+    missing: list[date] = []
+    for week in weeks:
+        stored = _read_week(week, digests[week])
+        if stored is None:
+            missing.append(week)
+        else:
+            parts.append(stored)
+    if missing:
+        fresh = weekly_aggregates(dfs, missing)
+        if isinstance(fresh, pl.LazyFrame):
+            fresh = fresh.collect()
+        for week in missing:
+            agg = fresh.filter(pl.col("week_start") == week)
+            _write_week(week, agg, digests[week])
+            parts.append(agg)
+    log.info(
+        "weekly_store_loaded",
+        weeks=[w.isoformat() for w in weeks],
+        hits=len(weeks) - len(missing),
+        computed=[w.isoformat() for w in missing],
+    )
+    return pl.concat(parts, how="vertical_relaxed")
+
+
+def _features(history: FrameT, by: list = KEYS) -> FrameT:
+    return history.group_by(by).agg(
+        pl.col("views").sum().cast(COUNT_DTYPE).alias("cantidad_vistas"),
+        pl.col("taps").sum().cast(COUNT_DTYPE).alias("cantidad_taps"),
+        pl.col("pays").sum().cast(COUNT_DTYPE).alias("cantidad_pagos"),
+        pl.col("total").sum().cast(pl.Int64).alias("total_pagos"),
+    )
+
+
+def _week_plan(dfs: dict, as_of: date | None) -> dict[date, set[str]]:
+    if as_of is not None:
+        return {w: set(dfs) for w in history_weeks(week_of(as_of))}
+    plan: dict[date, set[str]] = {}
+    for name, weeks in week_anchors(dfs).items():
+        for week in weeks[:HISTORY_WEEKS]:
+            plan.setdefault(week, set()).add(name)
+    return dict(sorted(plan.items()))
+
+
+def _owned(
+    history: pl.DataFrame, plan: dict[date, set[str]]
+) -> pl.DataFrame:
+    return history.with_columns(
+        pl.when(
+            pl.col("week_start").is_in(
+                [w for w, names in plan.items() if name in names]
+            )
+        )
+        .then(pl.col(col))
+        .otherwise(0)
+        .alias(col)
+        for name, cols in SOURCE_COLS.items()
+        for col in cols
+    )
+
+
+def incremental_features(
+    dfs: dict, as_of: date | None = None, source: str = ETL_SOURCE
+) -> pl.DataFrame | None:
+    plan = _week_plan(dfs, as_of)
+    if not plan:
+        return None
+    history = load_history(dfs, list(plan), source)
+    return _features(_owned(history, plan))
+
+
+def spilled_features(
+    dfs: dict, spill_dir: str, as_of: date | None = None
+) -> pl.LazyFrame | None:
+    plan = _week_plan(dfs, as_of)
+    if not plan:
+        return None
+    fs, path = fsspec.core.url_to_fs(spill_dir)
+    fs.makedirs(path, exist_ok=True)
+    for week, names in plan.items():
+        week_dfs = {
+            name: df if name in names else df.clear()
+            for name, df in dfs.items()
+        }
+        agg = weekly_aggregates(week_dfs, [week])
+        agg.lazy().sink_parquet(
+            f"{spill_dir}/{week.isoformat()}.parquet", engine="streaming"
+        )
+    log.info("weekly_aggregates_spilled", spill_dir=spill_dir)
+    return _features(pl.scan_parquet(f"{spill_dir}/*.parquet"))
+
+
+def backfill_weeks(first: date, last: date) -> list[date]:
+    start, end = week_of(first), week_of(last)
+    return [
+        start + timedelta(weeks=n)
+        for n in range((end - start).days // 7 + 1)
+    ]
+
+
+def rolling_features(dfs: dict, weeks: list[date]) -> pl.LazyFrame:
+    history = weekly_aggregates(
+        dfs, history_weeks(weeks[0]) + weeks[:-1]
+    ).lazy()
+    shifted = pl.concat(
+        history.with_columns(
+            (pl.col("week_start") + timedelta(weeks=n)).alias(PARTITION_COL)
+        )
+        for n in range(1, HISTORY_WEEKS + 1)
+    )
+    return _features(
+        shifted.filter(pl.col(PARTITION_COL).is_in(weeks)),
+        [PARTITION_COL, *KEYS],
+    )
+
+
+def backfill_output(dfs: dict, first: date, last: date) -> pl.LazyFrame:
+    weeks = backfill_weeks(first, last)
+    prints = between_dates(
+        dfs["prints"].lazy(), "day", weeks[0], weeks[-1] + timedelta(days=6)
+    )
+    base_cols = [
+        c for c in prints.collect_schema().names() if c != PARTITION_COL
+    ]
+    out = prints.with_columns(
+        pl.col("day").dt.truncate("1w").alias(PARTITION_COL)
+    )
+    return join_features(
+        out, rolling_features(dfs, weeks), [PARTITION_COL, *KEYS]
+    ).select(*base_cols, *FEATURE_COLS, PARTITION_COL)
+
+
+def backfill_and_export(
+    dfs: dict, first: date, last: date, out_dir: str | None = None
+) -> str:
+    target = out_dir or f"{OUT_DATA_DIR}/{BACKFILL_NAME}"
+    staging = storage.staging_dir(target)
+    with stage_span("backfill"):
+        try:
+            backfill_output(dfs, first, last).sink_parquet(
+                pl.PartitionByKey(
+                    staging, by=PARTITION_COL, include_key=False
+                ),
+                mkdir=True,
+                storage_options=storage_options(staging),
+                engine="streaming",
+                **PARQUET_OPTIONS.kwargs(),
+            )
+        except Exception:
+            storage.remove_dir(staging)
+            raise
+        storage.swap_dir(staging, target)
+    log.info(
+        "backfill_done",
+        first=first.isoformat(),
+        last=last.isoformat(),
+        path=target,
+    )
+    return target
@@ -18,6 +18,9 @@ def _resolve_path(var_name: str, default: Path) -> str:
 
 RAW_DATA_DIR = _resolve_path("RAW_DATA_DIR", PROJECT_ROOT / "data" / "raw")
 OUT_DATA_DIR = _resolve_path("OUT_DATA_DIR", PROJECT_ROOT / "data" / "out")
+CURATED_DATA_DIR = _resolve_path(
+    "CURATED_DATA_DIR", PROJECT_ROOT / "data" / "curated"
+)
 EXPECTATIONS_REPORTS_DIR = _resolve_path(
     "EXPECTATIONS_REPORTS_DIR", PROJECT_ROOT / "expectations" / "reports"
 )
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import os
+import tempfile
+from datetime import date
+from dotenv import load_dotenv
+from src.config.paths import PROJECT_ROOT
+
+load_dotenv(str(PROJECT_ROOT / ".env"))
+
+ENGINES = ("eager", "lazy", "streaming")
+
+
+def _resolve_choice(
+    var_name: str, choices: tuple[str, ...], default: str
+) -> str:
+    val = (os.getenv(var_name) or default).strip().lower()
+    if val not in choices:
+        raise ValueError(f"{var_name}={val!r} not in {choices}")
+    return val
+
+
+ETL_ENGINE = _resolve_choice("ETL_ENGINE", ENGINES, "eager")
+ETL_SOURCE = _resolve_choice("ETL_SOURCE", ("raw", "curated"), "raw")
+
+
+def _resolve_date(var_name: str) -> date | None:
+    val = (os.getenv(var_name) or "").strip()
+    return date.fromisoformat(val) if val else None
+
+
+ETL_AS_OF = _resolve_date("ETL_AS_OF")
+
+
+def _resolve_bool(var_name: str, default: bool = False) -> bool:
+    val = (os.getenv(var_name) or "").strip().lower()
+    if not val:
+        return default
+    return val in ("1", "true", "yes", "on")
+
+
+ETL_INCREMENTAL = _resolve_bool("ETL_INCREMENTAL")
+ETL_RUN_CACHE = _resolve_bool("ETL_RUN_CACHE", default=True)
+
+
+def _resolve_int(var_name: str, default: int) -> int:
+    val = (os.getenv(var_name) or "").strip()
+    n = int(val) if val else default
+    if n < 1:
+        raise ValueError(f"{var_name}={n} must be >= 1")
+    return n
+
+
+LOAD_WORKERS = _resolve_int("LOAD_WORKERS", 3)
+ETL_MEMORY_BUDGET_MB = _resolve_int("ETL_MEMORY_BUDGET_MB", 2048)
+ETL_SPILL_DIR = os.getenv("ETL_SPILL_DIR") or os.path.join(
+    tempfile.gettempdir(), "etl_spill"
+)
+
+PARQUET_COMPRESSIONS = ("zstd", "snappy", "lz4", "gzip", "brotli", "none")
+PARQUET_COMPRESSION = _resolve_choice(
+    "PARQUET_COMPRESSION", PARQUET_COMPRESSIONS, "zstd"
+)
+
+
+def _resolve_optional_int(var_name: str) -> int | None:
+    val = (os.getenv(var_name) or "").strip()
+    return _resolve_int(var_name, 1) if val else None
+
+
+PARQUET_COMPRESSION_LEVEL = _resolve_optional_int("PARQUET_COMPRESSION_LEVEL")
+PARQUET_ROW_GROUP_SIZE = _resolve_optional_int("PARQUET_ROW_GROUP_SIZE")
+PARQUET_STATISTICS = _resolve_bool("PARQUET_STATISTICS", default=True)
+EXPORT_BLOCK_SIZE_MB = _resolve_int("EXPORT_BLOCK_SIZE_MB", 16)
+STORAGE_BACKEND = _resolve_choice(
+    "STORAGE_BACKEND", ("native", "fsspec"), "native"
+)
+RAW_CACHE = _resolve_bool("RAW_CACHE", default=True)
+RAW_CACHE_DIR = os.getenv("RAW_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), "etl_raw_cache"
+)
+RAW_CACHE_MAX_MB = _resolve_int("RAW_CACHE_MAX_MB", 10240)
+REPORT_WRITE_MODE = _resolve_choice(
+    "REPORT_WRITE_MODE", ("sync", "async"), "sync"
+)
+REPORT_WORKERS = _resolve_int("REPORT_WORKERS", 4)
+TRANSFORM_SHARDS = _resolve_int("TRANSFORM_SHARDS", 1)
+TRANSFORM_SHARD_THREADS = _resolve_optional_int("TRANSFORM_SHARD_THREADS")
+ARTIFACTS_TTL_HOURS = _resolve_int("ARTIFACTS_TTL_HOURS", 24)
+SERVING_INDEX = _resolve_bool("SERVING_INDEX")
+
+
+def _resolve_columns(
+    var_name: str, default: tuple[str, ...]
+) -> tuple[str, ...]:
+    val = os.getenv(var_name)
+    if val is None:
+        return default
+    cols = tuple(c.strip() for c in val.split(",") if c.strip())
+    if len(set(cols)) != len(cols):
+        raise ValueError(f"{var_name}={val!r} repeats a column")
+    return cols
+
+
+EXPORT_SORT_BY = _resolve_columns(
+    "EXPORT_SORT_BY", ("user_id", "value_prop", "day")
+)
+EXPORT_SORT_STREAMING = _resolve_bool("EXPORT_SORT_STREAMING")
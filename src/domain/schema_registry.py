@@ -1,11 +1,13 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import TypeAlias, Union, Type
+from dataclasses import dataclass, field
+from typing import TypeAlias, TypeVar, Union, Type
 import os
 import polars as pl
+from src.config.paths import CURATED_DATA_DIR
 
 _PolarsBase = pl.DataType
 PolarsDType: TypeAlias = Union[Type[_PolarsBase], _PolarsBase]
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
 
 
 @dataclass(frozen=True)
@@ -16,8 +18,23 @@ class DatasetSpec:
     raw_schema: dict[str, PolarsDType]
     flat_expected_cols: list[str]
     allow_new_columns: bool = True
+    date_col: str | None = None
+    curated_path: str | None = None
+    compact_types: dict[str, PolarsDType] = field(default_factory=dict)
 
 
+VALUE_PROPS = (
+    "cellphone_recharge",
+    "credits_consumer",
+    "link_cobro",
+    "point",
+    "prepaid",
+    "send_money",
+    "transport",
+)
+
+CATEGORICAL_DOMAINS: dict[str, pl.Enum] = {"value_prop": pl.Enum(VALUE_PROPS)}
+
 EVENT_STRUCT: pl.Struct = pl.Struct(
     [pl.Field("position", pl.Int64), pl.Field("value_prop", pl.Utf8)]
 )
@@ -37,6 +54,15 @@ EVENTS_RAW_SCHEMA: dict[str, PolarsDType] = {
 
 EVENTS_FLAT_COLS = ["day", "position", "value_prop", "user_id"]
 
+PAYS_COMPACT_TYPES: dict[str, PolarsDType] = {"user_id": pl.UInt32}
+
+EVENTS_COMPACT_TYPES: dict[str, PolarsDType] = {
+    "position": pl.UInt8,
+    "user_id": pl.UInt32,
+}
+
+PARTITION_COL = "week_start"
+
 RAW_DIR = os.getenv("RAW_DATA_DIR", "data/raw").rstrip("/")
 OUT_DIR = os.getenv("OUT_DATA_DIR", "data/out").rstrip("/")
 EXPECTATIONS_DIR = os.getenv(
@@ -56,6 +82,9 @@ DATASETS: dict[str, DatasetSpec] = {
         raw_schema=PAYS_RAW_SCHEMA,
         flat_expected_cols=[],
         allow_new_columns=True,
+        date_col="pay_date",
+        curated_path=_join(CURATED_DATA_DIR, "pays"),
+        compact_types=PAYS_COMPACT_TYPES,
     ),
     "taps": DatasetSpec(
         name="taps",
@@ -64,6 +93,9 @@ DATASETS: dict[str, DatasetSpec] = {
         raw_schema=EVENTS_RAW_SCHEMA,
         flat_expected_cols=EVENTS_FLAT_COLS,
         allow_new_columns=True,
+        date_col="day",
+        curated_path=_join(CURATED_DATA_DIR, "taps"),
+        compact_types=EVENTS_COMPACT_TYPES,
     ),
     "prints": DatasetSpec(
         name="prints",
@@ -72,5 +104,8 @@ DATASETS: dict[str, DatasetSpec] = {
         raw_schema=EVENTS_RAW_SCHEMA,
         flat_expected_cols=EVENTS_FLAT_COLS,
         allow_new_columns=True,
+        date_col="day",
+        curated_path=_join(CURATED_DATA_DIR, "prints"),
+        compact_types=EVENTS_COMPACT_TYPES,
     ),
 }
@@ -0,0 +1,34 @@
+import os
+import polars as pl
+from polars.testing import assert_frame_equal
+import src.adapters.artifacts as art
+
+
+def test_artifacts_round_trip_by_uri(tmp_path, monkeypatch):
+    monkeypatch.setattr(art, "ARTIFACTS_DIR", str(tmp_path))
+    dfs = {
+        "pays": pl.DataFrame({"user_id": [1, 2], "total": [1.5, 2.0]}),
+        "prints": pl.DataFrame({"user_id": [3], "value_prop": ["a"]}),
+    }
+    run_id = "scheduled__2025-01-01T00:05:00+00:00"
+    uris = art.write_artifacts(dfs, run_id)
+    assert all(":" not in u.split("/")[-2] for u in uris.values())
+    assert list(uris) == ["pays", "prints"]
+
+    back = art.read_artifacts(uris)
+    for name, df in dfs.items():
+        assert_frame_equal(back[name], df)
+
+    art.clear_artifacts(run_id)
+    assert not any(tmp_path.iterdir())
+
+
+def test_sweep_removes_only_stale_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(art, "ARTIFACTS_DIR", str(tmp_path))
+    df = pl.DataFrame({"a": [1]})
+    art.write_artifacts({"pays": df}, "old")
+    art.write_artifacts({"pays": df}, "new")
+    os.utime(tmp_path / "old" / "pays.arrow", (0, 0))
+
+    assert art.sweep_artifacts(max_age_hours=1) == ["old"]
+    assert [p.name for p in tmp_path.iterdir()] == ["new"]
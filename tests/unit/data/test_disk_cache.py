@@ -0,0 +1,60 @@
+import os
+import fsspec  # type: ignore[import-untyped]
+import polars as pl
+from src.adapters import disk_cache, storage
+
+
+def _put(uri: str, data: bytes) -> None:
+    with fsspec.open(uri, "wb") as f:
+        f.write(data)
+
+
+def test_remote_reads_are_served_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    uri = "memory://bucket/pays.csv"
+    _put(uri, b"user_id,total\n1,2.5\n")
+
+    first = disk_cache.cached_path(uri)
+    assert first.startswith(str(tmp_path))
+    assert disk_cache.cached_path(uri) == first
+    assert storage.read_csv(uri)["total"].to_list() == [2.5]
+
+    (tmp_path / first.rsplit("/", 1)[1]).write_bytes(b"user_id,total\n")
+    assert pl.read_csv(disk_cache.cached_path(uri)).height == 1
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(disk_cache, "MAX_BYTES", 25)
+    paths = []
+    for i, name in enumerate(("a", "b", "c")):
+        uri = f"memory://bucket/{name}.json"
+        _put(uri, b"x" * 10)
+        paths.append(disk_cache.cached_path(uri))
+        os.utime(paths[-1], (i, i))
+
+    remaining = {p.name for p in tmp_path.iterdir() if not p.suffix}
+    assert paths[0].rsplit("/", 1)[1] not in remaining
+    assert {p.rsplit("/", 1)[1] for p in paths[1:]} <= remaining
+
+
+def test_hits_hash_once_until_entry_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    hashed = []
+    sha256 = disk_cache._sha256
+    monkeypatch.setattr(
+        disk_cache, "_sha256", lambda p: hashed.append(p) or sha256(p)
+    )
+    uri = "memory://bucket/hits.csv"
+    _put(uri, b"a\n1\n")
+
+    entry = disk_cache.cached_path(uri)
+    for _ in range(3):
+        assert disk_cache.cached_path(uri) == entry
+    assert hashed == []
+
+    with open(entry, "wb") as f:
+        f.write(b"a\n2\n")
+    os.utime(entry, (1, 1))
+    assert pl.read_csv(disk_cache.cached_path(uri))["a"].to_list() == [1]
+    assert len(hashed) == 1
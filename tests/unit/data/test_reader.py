@@ -1,9 +1,14 @@
 import json
 import logging
 import polars as pl
+import pytest
 
-from src.adapters.reader import read_raw
-from src.domain.schema_registry import DatasetSpec
+from src.adapters.reader import read_raw, scan_raw
+from src.domain.schema_registry import (
+    DatasetSpec,
+    EVENTS_FLAT_COLS,
+    EVENTS_RAW_SCHEMA,
+)
 
 
 def test_read_raw_pays_ok(tmp_path, caplog):
@@ -120,3 +125,38 @@ def test_read_raw_invalid_kind():
         assert False, "Expected ValueError"
     except ValueError as e:
         assert str(e) == "other"
+
+
+def test_scan_raw_events_is_lazy(tmp_path):
+    p = tmp_path / "events.ndjson"
+    p.write_text(
+        json.dumps(
+            {
+                "day": "2020-11-01",
+                "event_data": {"position": 0, "value_prop": "point"},
+                "user_id": 1,
+            }
+        )
+    )
+    spec = DatasetSpec(
+        name="prints",
+        kind="events",
+        raw_path=str(p),
+        raw_schema=EVENTS_RAW_SCHEMA,
+        flat_expected_cols=EVENTS_FLAT_COLS,
+    )
+    lf = scan_raw(spec)
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().height == 1
+
+
+def test_scan_raw_invalid_kind():
+    spec = DatasetSpec(
+        name="x",
+        kind="other",
+        raw_path="ignored",
+        raw_schema={"a": pl.Int64},
+        flat_expected_cols=["a"],
+    )
+    with pytest.raises(ValueError):
+        scan_raw(spec)
@@ -0,0 +1,35 @@
+import json
+import pytest
+from src.adapters.reports import ReportSink
+
+
+def test_sync_sink_writes_immediately(tmp_path):
+    uri = str(tmp_path / "pays" / "schema_raw.json")
+    ReportSink("sync").write(uri, {"ok": True})
+    assert json.loads(open(uri).read()) == {"ok": True}
+
+
+def test_async_sink_writes_on_flush(tmp_path):
+    sink = ReportSink("async", workers=2)
+    uris = [str(tmp_path / f"d{i}" / "schema_raw.json") for i in range(6)]
+    payload = {"rows": 1}
+    for uri in uris:
+        sink.write(uri, payload)
+    payload["rows"] = 2
+    assert sink.flush() == 6
+    assert all(json.loads(open(u).read()) == {"rows": 1} for u in uris)
+    assert sink.flush() == 0
+
+
+def test_async_sink_surfaces_errors(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    sink = ReportSink("async")
+    sink.write(str(blocker / "schema_raw.json"), {})
+    sink.write(str(tmp_path / "ok.json"), {})
+    with pytest.raises(OSError):
+        sink.flush()
+    assert (tmp_path / "ok.json").exists()
+
+    sink.write(str(blocker / "schema_raw.json"), {})
+    assert sink.flush(strict=False) == 0
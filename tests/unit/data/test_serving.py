@@ -0,0 +1,64 @@
+import polars as pl
+from polars.testing import assert_frame_equal
+from src.adapters.serving import (
+    FeatureLookup,
+    offset_index,
+    write_serving_index,
+)
+from src.application import transform_service as ts
+
+
+def _out() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "user_id": pl.Series([7, 3, 7, 1, 3, 7], dtype=pl.UInt32),
+            "value_prop": ["a", "b", "c", "a", "a", "b"],
+            "cantidad_vistas": [1, 2, 3, 4, 5, 6],
+        }
+    )
+
+
+def test_offset_index_covers_sorted_runs():
+    table = _out().sort("user_id", maintain_order=True)
+    index = offset_index(table)
+    assert index.to_dicts() == [
+        {"user_id": 1, "start": 0, "length": 1},
+        {"user_id": 3, "start": 1, "length": 2},
+        {"user_id": 7, "start": 3, "length": 3},
+    ]
+
+
+def test_lookup_returns_user_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(ts, "SERVING_INDEX", True)
+    out = _out()
+    ts.export_output(out, out_dir=str(tmp_path))
+
+    lookup = FeatureLookup(str(tmp_path / "serving"))
+    assert len(lookup) == 3
+    for user in (1, 3, 7):
+        assert_frame_equal(
+            lookup.get(user).sort("value_prop"),
+            out.filter(pl.col("user_id") == user).sort("value_prop"),
+        )
+    assert lookup.get(5).is_empty()
+    assert lookup.get(99).is_empty()
+
+
+def test_serving_index_drops_null_users_and_keeps_sorted_input(tmp_path):
+    out = pl.concat(
+        [
+            _out().sort("user_id", "value_prop"),
+            pl.DataFrame(
+                {
+                    "user_id": [None],
+                    "value_prop": ["z"],
+                    "cantidad_vistas": [0],
+                },
+                schema=_out().schema,
+            ),
+        ]
+    )
+    serving_dir = write_serving_index(out, str(tmp_path))
+    table = pl.read_ipc(f"{serving_dir}/features.arrow")
+    assert_frame_equal(table, out.head(6))
+    assert len(FeatureLookup(serving_dir)) == 3
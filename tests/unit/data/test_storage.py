@@ -0,0 +1,50 @@
+import polars as pl
+from polars.testing import assert_frame_equal
+from src.adapters import storage
+
+
+def test_storage_options_from_env(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "minio")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("S3_ENDPOINT_URL", "http://minio:9000")
+    assert storage.storage_options("s3://bucket/key.csv") == {
+        "aws_access_key_id": "minio",
+        "aws_secret_access_key": "secret",
+        "aws_region": "us-east-1",
+        "aws_endpoint_url": "http://minio:9000",
+        "aws_allow_http": "true",
+    }
+    assert storage.storage_options("data/raw/pays.csv") is None
+    assert storage.storage_options("file:///tmp/pays.csv") is None
+
+
+def test_use_fsspec_only_for_remote_with_backend(monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "fsspec")
+    assert storage.use_fsspec("s3://bucket/key.csv")
+    assert not storage.use_fsspec("data/raw/pays.csv")
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "native")
+    assert not storage.use_fsspec("s3://bucket/key.csv")
+
+
+def test_local_round_trip(tmp_path):
+    df = pl.DataFrame({"user_id": [1, 2, 3], "value_prop": ["a", "b", "c"]})
+    csv = storage.write_csv(df, str(tmp_path / "f.csv"))
+    pq = storage.write_parquet(df, str(tmp_path / "f.parquet"))
+    assert_frame_equal(storage.read_csv(csv), df)
+    assert_frame_equal(storage.scan_csv(csv).collect(), df)
+    assert_frame_equal(storage.read_parquet(pq), df)
+    assert_frame_equal(storage.scan_parquet(pq).collect(), df)
+
+
+def test_fsspec_reads_spool_through_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "fsspec")
+    monkeypatch.setattr(storage, "RAW_CACHE", False)
+    monkeypatch.setattr(storage.disk_cache, "CACHE_DIR", str(tmp_path))
+    df = pl.DataFrame({"a": [1, 2]})
+    csv = storage.write_csv(df, "memory://spool/f.csv")
+    pq = storage.write_parquet(df, "memory://spool/f.parquet")
+    assert_frame_equal(storage.scan_csv(csv).collect(), df)
+    assert_frame_equal(storage.read_parquet(pq), df)
+    assert len([p for p in tmp_path.iterdir() if not p.suffix]) == 2
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+import polars as pl
+from polars.testing import assert_frame_equal
+from src.adapters.writer import (
+    ParquetOptions,
+    sink_outputs,
+    write_manifest,
+    write_outputs,
+)
+
+
+def _df() -> pl.DataFrame:
+    return pl.DataFrame(
+        {"user_id": list(range(5000)), "value_prop": ["a", "b"] * 2500}
+    )
+
+
+def test_write_outputs_writes_both_formats(tmp_path):
+    df = _df()
+    csv, pq = write_outputs(
+        df, str(tmp_path / "f.csv"), str(tmp_path / "f.parquet")
+    )
+    assert_frame_equal(pl.read_csv(csv), df)
+    assert_frame_equal(pl.read_parquet(pq), df)
+
+
+def test_parquet_options_are_applied(tmp_path):
+    df = _df()
+    plain = ParquetOptions(compression="none", row_group_size=1000)
+    _, raw = write_outputs(
+        df, str(tmp_path / "a.csv"), str(tmp_path / "a.parquet"), plain
+    )
+    _, packed = write_outputs(
+        df,
+        str(tmp_path / "b.csv"),
+        str(tmp_path / "b.parquet"),
+        ParquetOptions(compression="zstd", compression_level=19),
+    )
+    assert plain.kwargs()["compression"] == "uncompressed"
+    assert (tmp_path / "a.parquet").stat().st_size > (
+        tmp_path / "b.parquet"
+    ).stat().st_size
+    assert_frame_equal(pl.read_parquet(raw), pl.read_parquet(packed))
+
+
+def test_sink_outputs_streams_both_formats(tmp_path):
+    df = _df()
+    csv, pq = sink_outputs(
+        df.lazy(), str(tmp_path / "s.csv"), str(tmp_path / "s.parquet")
+    )
+    assert_frame_equal(pl.read_csv(csv), df)
+    assert_frame_equal(pl.read_parquet(pq), df)
+
+
+def test_write_manifest_records_layout(tmp_path):
+    df = _df().sort("user_id")
+    _, pq = write_outputs(
+        df, str(tmp_path / "m.csv"), str(tmp_path / "m.parquet")
+    )
+    opts = ParquetOptions(row_group_size=1000)
+    uri = write_manifest(pq, ("user_id",), opts)
+    assert uri == str(tmp_path / "m.manifest.json")
+    manifest = json.loads(Path(uri).read_text())
+    assert manifest["rows"] == 5000
+    assert manifest["sort_by"] == ["user_id"]
+    assert manifest["key_ranges"] == {"user_id": [0, 4999]}
+    assert manifest["parquet"]["row_group_size"] == 1000
@@ -0,0 +1,43 @@
+import json
+from pathlib import Path
+import polars as pl
+from apps.bench import run as bench
+from apps.bench.synthetic import generate
+from src.application import validation
+from src.application.validation import REPORT_BASE, validate_raw_schema
+
+
+def test_generate_is_seeded_and_schema_valid(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation, "REPORT_BASE", str(tmp_path / "reports"))
+    a = generate(str(tmp_path / "a"), rows=5_000, seed=7)
+    b = generate(str(tmp_path / "b"), rows=5_000, seed=7)
+    for name in a:
+        with open(a[name], "rb") as fa, open(b[name], "rb") as fb:
+            assert fa.read() == fb.read()
+
+    prints = pl.read_ndjson(a["prints"])
+    assert prints.height == 5_000
+    top = prints["user_id"].value_counts(sort=True)["count"]
+    assert top[0] > 10 * top[-1]
+
+    for name, spec in bench.bench_specs(str(tmp_path / "a")).items():
+        ok, _ = validate_raw_schema(spec, strict=True)
+        assert ok, name
+
+
+def test_bench_run_reports_every_stage(tmp_path):
+    generate(str(tmp_path), rows=2_000)
+    report = bench.run(str(tmp_path), str(tmp_path / "out"))
+    stages = [(r["stage"], r["dataset"]) for r in report["stages"]]
+    assert ("build_output_and_export", "all") in stages
+    assert len(stages) == 3 * 3 + 1
+    assert all(r["peak_rss_mb"] > 0 for r in report["stages"])
+    assert (tmp_path / "out" / "final.parquet").exists()
+    reports = tmp_path / "out" / "reports"
+    assert sorted(p.name for p in reports.iterdir()) == [
+        "bench_pays",
+        "bench_prints",
+        "bench_taps",
+    ]
+    assert not list(Path(REPORT_BASE).glob("bench_*"))
+    json.dumps(report)
@@ -0,0 +1,130 @@
+import json
+from datetime import date, timedelta
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+import src.application.dq_and_load as loader
+import src.application.ingest as ingest
+from src.application.transform_service import build_output
+from src.domain.schema_registry import (
+    DatasetSpec,
+    EVENTS_FLAT_COLS,
+    EVENTS_RAW_SCHEMA,
+    PAYS_RAW_SCHEMA,
+)
+
+
+def _specs(tmp_path) -> dict[str, DatasetSpec]:
+    start = date(2020, 10, 5)
+    events = [
+        {
+            "day": (start + timedelta(days=2 * i)).isoformat(),
+            "event_data": {"position": i % 4, "value_prop": "ab"[i % 2]},
+            "user_id": i % 3,
+        }
+        for i in range(20)
+    ]
+    (tmp_path / "prints.json").write_text(
+        "\n".join(json.dumps(e) for e in events)
+    )
+    (tmp_path / "taps.json").write_text(
+        "\n".join(json.dumps(e) for e in events[::3])
+    )
+    (tmp_path / "pays.csv").write_text(
+        "pay_date,total,user_id,value_prop\n"
+        + "".join(
+            f"{(start + timedelta(days=3 * i)).isoformat()},{i}.5,{i % 3},"
+            f"{'ab'[i % 2]}\n"
+            for i in range(12)
+        )
+    )
+    specs = {}
+    for name, kind, raw, schema, cols, date_col in (
+        ("pays", "pays", "pays.csv", PAYS_RAW_SCHEMA, [], "pay_date"),
+        (
+            "taps",
+            "events",
+            "taps.json",
+            EVENTS_RAW_SCHEMA,
+            EVENTS_FLAT_COLS,
+            "day",
+        ),
+        (
+            "prints",
+            "events",
+            "prints.json",
+            EVENTS_RAW_SCHEMA,
+            EVENTS_FLAT_COLS,
+            "day",
+        ),
+    ):
+        specs[name] = DatasetSpec(
+            name=name,
+            kind=kind,
+            raw_path=str(tmp_path / raw),
+            raw_schema=schema,
+            flat_expected_cols=cols,
+            date_col=date_col,
+            curated_path=str(tmp_path / "curated" / name),
+        )
+    return specs
+
+
+def test_ingest_then_curated_read_matches_raw(tmp_path, monkeypatch):
+    specs = _specs(tmp_path)
+    monkeypatch.setattr(loader, "DATASETS", specs)
+    monkeypatch.setattr(ingest, "DATASETS", specs)
+    monkeypatch.chdir(tmp_path)
+
+    paths = ingest.ingest_all()
+    assert set(paths) == {"pays", "taps", "prints"}
+    weeks = sorted(
+        p.name for p in (tmp_path / "curated" / "prints").iterdir()
+    )
+    assert weeks[0] == "week_start=2020-10-05"
+    assert len(weeks) == 6
+
+    raw = loader.load_and_prepare_all()
+    curated = loader.load_and_prepare_all(source="curated")
+    assert "week_start" in curated["prints"].columns
+
+    keys = ["user_id", "value_prop", "day", "position"]
+    exp = build_output(raw)
+    got = build_output(curated)
+    assert isinstance(exp, pl.DataFrame) and isinstance(got, pl.DataFrame)
+    assert_frame_equal(got.sort(keys), exp.sort(keys))
+
+
+def test_curated_window_prunes_partitions(tmp_path, monkeypatch):
+    specs = _specs(tmp_path)
+    monkeypatch.setattr(loader, "DATASETS", specs)
+    monkeypatch.setattr(ingest, "DATASETS", specs)
+    monkeypatch.chdir(tmp_path)
+    ingest.ingest_all()
+
+    dfs = loader.load_and_prepare_all(
+        lazy=True, as_of=date(2020, 11, 4), source="curated"
+    )
+    weeks = dfs["prints"].select(pl.col("week_start").unique()).collect()
+    assert weeks["week_start"].min() == date(2020, 10, 12)
+    assert weeks["week_start"].max() == date(2020, 11, 2)
+
+
+def test_failed_ingest_keeps_previous_curated_data(tmp_path):
+    spec = _specs(tmp_path)["pays"]
+    df = pl.DataFrame(
+        {"pay_date": [date(2020, 10, 5)], "total": [1.0], "user_id": [1]}
+    )
+    ingest.ingest_dataset(spec, df.lazy())
+    before = sorted(p.name for p in (tmp_path / "curated").iterdir())
+
+    bad = df.lazy().with_columns(pl.col("total").str.to_integer())
+    with pytest.raises(pl.exceptions.PolarsError):
+        ingest.ingest_dataset(spec, bad)
+    assert sorted(p.name for p in (tmp_path / "curated").iterdir()) == before
+    assert (tmp_path / "curated" / "pays" / "week_start=2020-10-05").exists()
+
+    ingest.ingest_dataset(spec, df.lazy().with_columns(total=pl.lit(2.0)))
+    assert sorted(p.name for p in (tmp_path / "curated").iterdir()) == before
+    got = pl.read_parquet(tmp_path / "curated" / "pays" / "**" / "*.parquet")
+    assert got["total"].to_list() == [2.0]
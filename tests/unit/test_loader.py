@@ -1,4 +1,6 @@
 import logging
+import threading
+from datetime import date
 from typing import Dict
 import polars as pl
 import pytest
@@ -12,6 +14,8 @@ class DummySpec:
         self.raw_path = "dummy"
         self.raw_schema = {"a": pl.Int64}
         self.flat_expected_cols = ["a"]
+        self.date_col: str | None = None
+        self.compact_types: dict = {}
 
 
 def make_df(rows: int = 1) -> pl.DataFrame:
@@ -25,9 +29,8 @@ def test_load_and_prepare_all_ok(
     monkeypatch.setattr(loader, "DATASETS", {"dummy": spec}, raising=True)
 
     monkeypatch.setattr(
-        loader, "validate_raw_schema", lambda s, df, strict: (True, "ok")
+        loader, "read_validated", lambda s, strict: (make_df(2), True, "ok")
     )
-    monkeypatch.setattr(loader, "read_raw", lambda s: make_df(2))
     monkeypatch.setattr(loader, "flatten_events", lambda s, df: df)
     monkeypatch.setattr(
         loader, "validate_flat_columns", lambda s, df, strict: (True, "ok")
@@ -59,7 +62,7 @@ def test_load_and_prepare_all_raw_schema_fail(
     spec = DummySpec("bad")
     monkeypatch.setattr(loader, "DATASETS", {"bad": spec}, raising=True)
     monkeypatch.setattr(
-        loader, "validate_raw_schema", lambda *a, **k: (False, "bad schema")
+        loader, "read_validated", lambda *a, **k: (None, False, "bad schema")
     )
 
     with pytest.raises(AssertionError) as e:
@@ -76,9 +79,8 @@ def test_load_and_prepare_all_flat_schema_fail(
     monkeypatch.setattr(loader, "DATASETS", {"badflat": spec}, raising=True)
 
     monkeypatch.setattr(
-        loader, "validate_raw_schema", lambda *a, **k: (True, "ok")
+        loader, "read_validated", lambda *a, **k: (make_df(1), True, "ok")
     )
-    monkeypatch.setattr(loader, "read_raw", lambda s: make_df(1))
     monkeypatch.setattr(loader, "flatten_events", lambda s, df: df)
     monkeypatch.setattr(
         loader, "validate_flat_columns", lambda *a, **k: (False, "flat fail")
@@ -89,3 +91,116 @@ def test_load_and_prepare_all_flat_schema_fail(
 
     assert "FLAT schema failed for badflat" in str(e.value)
     assert "flat fail" in str(e.value)
+
+
+def test_load_and_prepare_all_lazy_uses_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec = DummySpec("dummy")
+    monkeypatch.setattr(loader, "DATASETS", {"dummy": spec}, raising=True)
+    monkeypatch.setattr(
+        loader, "validate_raw_schema", lambda s, df, strict: (True, "ok")
+    )
+    monkeypatch.setattr(loader, "scan_raw", lambda s: make_df(3).lazy())
+    monkeypatch.setattr(loader, "flatten_events", lambda s, df: df)
+    monkeypatch.setattr(
+        loader, "validate_flat_columns", lambda s, df, strict: (True, "ok")
+    )
+
+    result = loader.load_and_prepare_all(lazy=True)
+    assert isinstance(result["dummy"], pl.LazyFrame)
+    assert result["dummy"].collect().height == 3
+
+
+def test_load_and_prepare_all_as_of_filters_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec = DummySpec("dummy")
+    spec.date_col = "d"
+    monkeypatch.setattr(loader, "DATASETS", {"dummy": spec}, raising=True)
+    monkeypatch.setattr(
+        loader, "validate_raw_schema", lambda s, df, strict: (True, "ok")
+    )
+    raw = pl.DataFrame(
+        {"d": [date(2020, 9, 1), date(2020, 10, 20), date(2020, 11, 2)]}
+    )
+    monkeypatch.setattr(loader, "scan_raw", lambda s: raw.lazy())
+    monkeypatch.setattr(loader, "flatten_events", lambda s, df: df)
+    monkeypatch.setattr(
+        loader, "validate_flat_columns", lambda s, df, strict: (True, "ok")
+    )
+
+    result = loader.load_and_prepare_all(as_of=date(2020, 10, 27))
+    assert result["dummy"]["d"].to_list() == [date(2020, 10, 20)]
+
+
+def test_load_and_prepare_all_concurrent_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    specs = {n: DummySpec(n) for n in ("pays", "taps", "prints")}
+    monkeypatch.setattr(loader, "DATASETS", specs, raising=True)
+    barrier = threading.Barrier(3, timeout=5)
+    sizes = {"pays": 1, "taps": 2, "prints": 3}
+
+    def read(s, strict):
+        barrier.wait()
+        return make_df(sizes[s.name]), True, "ok"
+
+    monkeypatch.setattr(loader, "read_validated", read)
+    monkeypatch.setattr(loader, "flatten_events", lambda s, df: df)
+    monkeypatch.setattr(
+        loader, "validate_flat_columns", lambda s, df, strict: (True, "ok")
+    )
+
+    result = loader.load_and_prepare_all(workers=3)
+    assert list(result) == ["pays", "taps", "prints"]
+    assert [df.height for df in result.values()] == [1, 2, 3]
+
+
+def _vp_frames(values: list[str]) -> dict:
+    return {
+        "pays": pl.DataFrame({"value_prop": values[:1], "total": [1.0]}),
+        "prints": pl.DataFrame({"value_prop": values, "user_id": [1, 2]}),
+        "other": pl.DataFrame({"a": [1]}),
+    }
+
+
+def test_encode_domains_uses_enum_for_known_values() -> None:
+    dfs = loader.encode_domains(_vp_frames(["point", "prepaid"]))
+    enum = loader.CATEGORICAL_DOMAINS["value_prop"]
+    assert dfs["pays"].schema["value_prop"] == enum
+    assert dfs["prints"].schema["value_prop"] == enum
+    assert dfs["other"].columns == ["a"]
+
+
+def test_encode_domains_falls_back_to_categorical() -> None:
+    dfs = loader.encode_domains(_vp_frames(["point", "brand_new"]))
+    assert dfs["prints"].schema["value_prop"] == pl.Categorical()
+    assert dfs["prints"]["value_prop"].to_list() == ["point", "brand_new"]
+
+
+def test_encode_domains_resolves_lazy_frames() -> None:
+    known = {k: v.lazy() for k, v in _vp_frames(["point", "prepaid"]).items()}
+    out = loader.encode_domains(known)
+    enum = loader.CATEGORICAL_DOMAINS["value_prop"]
+    assert out["prints"].collect_schema()["value_prop"] == enum
+
+    unseen = {k: v.lazy() for k, v in _vp_frames(["point", "x"]).items()}
+    out = loader.encode_domains(unseen)
+    assert out["prints"].collect_schema()["value_prop"] == pl.Categorical()
+
+
+def test_encode_domains_same_dtype_for_eager_and_lazy() -> None:
+    eager = loader.encode_domains(_vp_frames(["point", "prepaid"]))
+    lazy = loader.encode_domains(
+        {k: v.lazy() for k, v in _vp_frames(["point", "prepaid"]).items()}
+    )
+    for name, frame in eager.items():
+        assert lazy[name].collect_schema() == frame.schema
+
+
+def test_narrow_applies_compact_types() -> None:
+    spec = DummySpec("dummy")
+    spec.compact_types = {"a": pl.UInt8, "missing": pl.UInt32}
+    out = loader._narrow(spec, make_df(3))  # type: ignore[arg-type]
+    assert out.schema == {"a": pl.UInt8}
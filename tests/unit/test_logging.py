@@ -46,3 +46,39 @@ def test_warnings_are_redirected_to_logging(capsys) -> None:
     out = strip_ansi(capsys.readouterr().out)
     assert "DeprecationWarning: going away soon" in out
     assert "py.warnings" in out
+
+
+def test_prod_profile_renders_json_through_queue(capsys, monkeypatch) -> None:
+    import json
+    import src.adapters.logging as lg
+
+    monkeypatch.setenv("LOG_PROFILE", "prod")
+    monkeypatch.setattr(lg, "_prod_listener", None)
+    try:
+        log = get_logger()
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        handler = root.handlers[0]
+        assert isinstance(handler, lg.QueueHandler)
+        get_logger()
+        assert logging.getLogger().handlers == [handler]
+
+        log.info("prod_event", foo=1)
+        lg.stop_prod_listener()
+
+        line = capsys.readouterr().out.strip().splitlines()[-1]
+        rec = json.loads(line)
+        assert rec["event"] == "prod_event" and rec["foo"] == 1
+        assert rec["level"] == "info"
+        assert "lineno" not in rec and "func_name" not in rec
+    finally:
+        monkeypatch.delenv("LOG_PROFILE")
+        get_logger()
+
+
+def test_unknown_profile_rejected(monkeypatch) -> None:
+    import pytest
+
+    monkeypatch.setenv("LOG_PROFILE", "verbose")
+    with pytest.raises(ValueError):
+        get_logger()
@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+import polars as pl
+import src.adapters.metrics as metrics
+
+
+def test_stage_span_records_output_and_timings():
+    metrics.reset_spans()
+    df = pl.DataFrame({"a": list(range(100))})
+    with metrics.stage_span("read", "pays", bytes_read=10) as span:
+        span.output(df)
+    with metrics.stage_span("flatten", "pays") as span:
+        span.output(df.lazy())
+
+    read, flatten = metrics.spans()
+    assert read.stage == "read" and read.dataset == "pays"
+    assert read.rows_out == 100 and read.bytes_read == 10
+    assert read.estimated_size == df.estimated_size()
+    assert read.wall_s >= 0 and read.cpu_s >= 0
+    assert flatten.rows_out is None and flatten.estimated_size is None
+    assert flatten.plan_only and not read.plan_only
+
+
+def test_stage_span_records_failed_stage():
+    metrics.reset_spans()
+    try:
+        with metrics.stage_span("export"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    (span,) = metrics.spans()
+    assert span.status == "error" and span.wall_s >= 0
+
+
+def test_write_run_summary(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "EXPECTATIONS_REPORTS_DIR", str(tmp_path))
+    metrics.reset_spans()
+    with metrics.stage_span("export", rows_in=3):
+        pass
+    uri = metrics.write_run_summary(status="ok", engine="eager")
+    data = json.loads(Path(uri).read_text())
+    assert uri.endswith("run_summary.json")
+    assert data["status"] == "ok" and data["engine"] == "eager"
+    assert [s["stage"] for s in data["stages"]] == ["export"]
+    assert data["stages"][0]["rows_in"] == 3
+
+
+def test_uri_size_missing_file(tmp_path):
+    assert metrics.uri_size(str(tmp_path / "nope")) is None
+    (tmp_path / "f").write_bytes(b"abc")
+    assert metrics.uri_size(str(tmp_path / "f")) == 3
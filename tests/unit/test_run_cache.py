@@ -0,0 +1,95 @@
+import os
+from dataclasses import replace
+import polars as pl
+import src.application.run_cache as rc
+from src.domain.schema_registry import DatasetSpec
+
+
+def _setup(tmp_path, monkeypatch):
+    raw = tmp_path / "pays.csv"
+    raw.write_text("a\n1\n")
+    spec = DatasetSpec(
+        name="pays",
+        kind="pays",
+        raw_path=str(raw),
+        raw_schema={"a": pl.Int64},
+        flat_expected_cols=["a"],
+    )
+    monkeypatch.setattr(rc, "DATASETS", {"pays": spec})
+    monkeypatch.setattr(rc, "OUT_DATA_DIR", str(tmp_path))
+    return raw, spec
+
+
+def test_unchanged_after_save(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    fp = rc.input_fingerprint()
+    assert rc.is_unchanged(fp) is False
+    rc.save_fingerprint(fp)
+    assert rc.is_unchanged(fp) is False
+    (tmp_path / "final.parquet").write_bytes(b"")
+    assert rc.is_unchanged(rc.input_fingerprint()) is True
+
+
+def test_changes_invalidate_cache(tmp_path, monkeypatch):
+    raw, spec = _setup(tmp_path, monkeypatch)
+    (tmp_path / "final.parquet").write_bytes(b"")
+    rc.save_fingerprint(rc.input_fingerprint())
+
+    assert rc.is_unchanged(rc.input_fingerprint(source="curated")) is False
+
+    changed = replace(spec, raw_schema={"a": pl.Float64})
+    monkeypatch.setattr(rc, "DATASETS", {"pays": changed})
+    assert rc.is_unchanged(rc.input_fingerprint()) is False
+    monkeypatch.setattr(rc, "DATASETS", {"pays": spec})
+
+    raw.write_text("a\n1\n2\n")
+    os.utime(raw, (1, 1))
+    assert rc.is_unchanged(rc.input_fingerprint()) is False
+
+
+def test_compact_types_and_domains_invalidate(tmp_path, monkeypatch):
+    _, spec = _setup(tmp_path, monkeypatch)
+    (tmp_path / "final.parquet").write_bytes(b"")
+    rc.save_fingerprint(rc.input_fingerprint())
+
+    narrowed = replace(spec, compact_types={"a": pl.UInt8})
+    monkeypatch.setattr(rc, "DATASETS", {"pays": narrowed})
+    assert rc.is_unchanged(rc.input_fingerprint()) is False
+    monkeypatch.setattr(rc, "DATASETS", {"pays": spec})
+    assert rc.is_unchanged(rc.input_fingerprint()) is True
+
+    domains = {"a": pl.Enum(["1", "2"])}
+    monkeypatch.setattr(rc, "CATEGORICAL_DOMAINS", domains)
+    assert rc.is_unchanged(rc.input_fingerprint()) is False
+
+
+def test_output_settings_and_curated_inputs_invalidate(tmp_path, monkeypatch):
+    _, spec = _setup(tmp_path, monkeypatch)
+    curated = tmp_path / "curated" / "pays"
+    (curated / "day=2020-11-01").mkdir(parents=True)
+    part = curated / "day=2020-11-01" / "part-0.parquet"
+    part.write_bytes(b"x")
+    spec = replace(spec, curated_path=str(curated))
+    monkeypatch.setattr(rc, "DATASETS", {"pays": spec})
+    (tmp_path / "final.parquet").write_bytes(b"")
+    rc.save_fingerprint(rc.input_fingerprint(source="curated"))
+    assert rc.is_unchanged(rc.input_fingerprint(source="curated"))
+
+    serving = rc.SERVING_INDEX
+    monkeypatch.setattr(rc, "SERVING_INDEX", not serving)
+    assert not rc.is_unchanged(rc.input_fingerprint(source="curated"))
+    monkeypatch.setattr(rc, "SERVING_INDEX", serving)
+    assert not rc.is_unchanged(
+        rc.input_fingerprint(source="curated", engine="streaming")
+    )
+
+    (curated / "day=2020-11-02").mkdir()
+    (curated / "day=2020-11-02" / "part-0.parquet").write_bytes(b"y")
+    assert not rc.is_unchanged(rc.input_fingerprint(source="curated"))
+
+
+def test_corrupt_cache_is_a_miss(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    (tmp_path / "final.parquet").write_bytes(b"")
+    (tmp_path / rc.CACHE_NAME).write_text("{not json")
+    assert rc.is_unchanged(rc.input_fingerprint()) is False
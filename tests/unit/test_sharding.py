@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from src.application import sharding
+from src.application.transform_service import build_output
+from tests.unit.data.pays import df_pays_raw
+from tests.unit.data.prints import df_prints_flat_expected
+from tests.unit.data.taps import df_taps_flat_expected
+
+SORT = ["day", "user_id", "value_prop", "position"]
+
+
+def _dfs() -> dict[str, pl.DataFrame]:
+    return {
+        "pays": df_pays_raw,
+        "taps": df_taps_flat_expected,
+        "prints": df_prints_flat_expected,
+    }
+
+
+def test_split_shards_partitions_every_user_once():
+    dfs = _dfs()
+    shards = sharding.split_shards(dfs, 3)
+    for name, df in dfs.items():
+        parts = [s[name] for s in shards]
+        assert sum(p.height for p in parts) == df.height
+        users = [set(p["user_id"].to_list()) for p in parts]
+        assert sum(len(u) for u in users) == len(set().union(*users))
+        lazy = sharding.split_shards({name: df.lazy()}, 3)
+        for part, lz in zip(parts, lazy):
+            assert_frame_equal(lz[name].collect(), part)
+
+
+def test_sharded_output_matches_single_process():
+    dfs = _dfs()
+    got = sharding.sharded_output(dfs, shards=3, threads=1)
+    exp = build_output(dfs)
+    assert isinstance(exp, pl.DataFrame)
+    assert_frame_equal(got.sort(SORT), exp.sort(SORT))
+
+
+def test_shard_parts_merge_into_final(tmp_path):
+    dfs = {k: v.lazy() for k, v in _dfs().items()}
+    as_of = date(2020, 11, 30)
+    parts_dir = str(tmp_path / "run_a" / "parts")
+    (tmp_path / "run_a" / "parts").mkdir(parents=True)
+    (tmp_path / "run_a" / "parts" / "part-00007.parquet").write_bytes(b"")
+    parts = [
+        sharding.export_shard(dfs, shard, 2, parts_dir, as_of)
+        for shard in range(2)
+    ]
+    assert [p.rsplit("/", 1)[1] for p in parts] == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    _, pq = sharding.merge_shards(2, parts_dir, as_of, str(tmp_path))
+    exp = build_output(_dfs(), as_of)
+    assert isinstance(exp, pl.DataFrame)
+    assert_frame_equal(pl.read_parquet(pq).sort(SORT), exp.sort(SORT))
+
+
+def test_sharded_output_matches_with_uneven_weeks():
+    dfs = _dfs()
+    last = dfs["prints"]["day"].max()
+    dfs["taps"] = dfs["taps"].filter(pl.col("day") < last)
+    dfs["pays"] = dfs["pays"].head(dfs["pays"].height // 2)
+    got = sharding.sharded_output(dfs, shards=2, threads=1)
+    exp = build_output(dfs)
+    assert isinstance(exp, pl.DataFrame)
+    assert_frame_equal(got.sort(SORT), exp.sort(SORT))
+
+
+def test_worker_threads_do_not_leak_into_parent(monkeypatch):
+    monkeypatch.delenv("POLARS_MAX_THREADS", raising=False)
+    with ProcessPoolExecutor(
+        1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=sharding._init_worker,
+        initargs=(1,),
+    ) as pool:
+        assert pool.submit(pl.thread_pool_size).result() == 1
+    assert "POLARS_MAX_THREADS" not in os.environ
+
+
+def test_check_engine_rejects_unsupported_combinations():
+    sharding.check_engine("streaming", 1, True)
+    sharding.check_engine("lazy", 4, False)
+    for engine, incremental in (("streaming", False), ("eager", True)):
+        with pytest.raises(ValueError):
+            sharding.check_engine(engine, 4, incremental)
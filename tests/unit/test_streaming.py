@@ -0,0 +1,48 @@
+from dataclasses import replace
+import polars as pl
+import src.application.streaming as st
+
+
+def test_configure_streaming_sizes_chunks_from_budget():
+    with st.configure_streaming(budget_mb=1) as small:
+        assert pl.Config.state(if_set=True)["POLARS_ENGINE_AFFINITY"] == (
+            "streaming"
+        )
+    with st.configure_streaming(budget_mb=4096) as large:
+        pass
+    assert small >= st._MIN_CHUNK_ROWS
+    assert large > small
+    assert "POLARS_ENGINE_AFFINITY" not in pl.Config.state(if_set=True)
+
+
+def test_streaming_features_spill_only_over_budget(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(st, "input_bytes", lambda source: 3 * 1024**2)
+
+    def spill(dfs, spill_dir, as_of):
+        calls.append(spill_dir)
+        (tmp_path / spill_dir.rsplit("/", 1)[1]).mkdir()
+        return "spilled"
+
+    monkeypatch.setattr(st, "spilled_features", spill)
+    (tmp_path / "keep").mkdir()
+    with st.streaming_features({}, budget_mb=4) as got:
+        assert got is None
+    with st.streaming_features(
+        {}, budget_mb=2, spill_root=str(tmp_path)
+    ) as got:
+        assert got == "spilled"
+        assert len(list(tmp_path.glob("run-*"))) == 1
+    assert len(calls) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["keep"]
+
+
+def test_input_bytes_sizes_curated_inputs(tmp_path, monkeypatch):
+    specs = {}
+    for name, spec in st.DATASETS.items():
+        part = tmp_path / name / "p=1"
+        part.mkdir(parents=True)
+        (part / "part-0.parquet").write_bytes(b"x" * 10)
+        specs[name] = replace(spec, curated_path=str(tmp_path / name))
+    monkeypatch.setattr(st, "DATASETS", specs)
+    assert st.input_bytes("curated") == 10 * len(specs)
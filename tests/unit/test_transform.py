@@ -1,3 +1,5 @@
+import json
+from datetime import date
 from pathlib import Path
 import polars as pl
 from polars.testing import assert_frame_equal
@@ -29,3 +31,188 @@ def test_build_output_ok(tmp_path: Path, monkeypatch) -> None:
         exp.sort(["user_id", "value_prop"]),
         check_dtypes=False,
     )
+
+
+def test_build_output_lazy_matches_eager(tmp_path: Path, monkeypatch) -> None:
+    dfs = {
+        "pays": df_pays_raw,
+        "taps": df_taps_flat_expected,
+        "prints": df_prints_flat_expected,
+    }
+    monkeypatch.setattr(ts, "OUT_DATA_DIR", tmp_path, raising=True)
+    eager_csv, _ = build_output_and_export(dfs)
+    eager = pl.read_csv(eager_csv)
+
+    lazy_dfs = {k: v.lazy() for k, v in dfs.items()}
+    lazy_csv, _ = build_output_and_export(lazy_dfs)
+    got = pl.read_csv(lazy_csv)
+
+    assert_frame_equal(
+        got.sort(["user_id", "value_prop"]),
+        eager.sort(["user_id", "value_prop"]),
+    )
+
+
+def test_stream_output_matches_eager(tmp_path: Path, monkeypatch) -> None:
+    dfs = {
+        "pays": df_pays_raw,
+        "taps": df_taps_flat_expected,
+        "prints": df_prints_flat_expected,
+    }
+    monkeypatch.setattr(ts, "OUT_DATA_DIR", tmp_path, raising=True)
+    eager_csv, eager_pq = build_output_and_export(dfs)
+    eager = pl.read_csv(eager_csv)
+    eager_typed = pl.read_parquet(eager_pq)
+
+    lazy_dfs = {k: v.lazy() for k, v in dfs.items()}
+    csv_path, pq_path = ts.stream_output_and_export(lazy_dfs)
+    keys = ["user_id", "value_prop"]
+    assert_frame_equal(pl.read_csv(csv_path).sort(keys), eager.sort(keys))
+    assert_frame_equal(
+        pl.read_parquet(pq_path).sort(keys), eager_typed.sort(keys)
+    )
+
+
+def test_exports_are_sorted_with_manifest(tmp_path: Path, monkeypatch):
+    dfs = {
+        "pays": df_pays_raw,
+        "taps": df_taps_flat_expected,
+        "prints": df_prints_flat_expected,
+    }
+    monkeypatch.setattr(ts, "OUT_DATA_DIR", tmp_path, raising=True)
+    monkeypatch.setattr(ts, "EXPORT_SORT_STREAMING", True)
+    keys = ["user_id", "value_prop", "day"]
+    for export in (build_output_and_export, ts.stream_output_and_export):
+        _, pq_path = export(dfs)
+        got = pl.read_parquet(pq_path)
+        assert_frame_equal(got, got.sort(keys))
+        manifest = json.loads((tmp_path / "final.manifest.json").read_text())
+        assert manifest["sort_by"] == keys
+        assert manifest["rows"] == got.height
+
+    monkeypatch.setattr(ts, "EXPORT_SORT_STREAMING", False)
+    ts.stream_output_and_export(dfs)
+    manifest = json.loads((tmp_path / "final.manifest.json").read_text())
+    assert manifest["sort_by"] == [] and manifest["key_ranges"] == {}
+
+
+def test_week_filters_keep_latest_and_three_previous() -> None:
+    df = pl.DataFrame(
+        {
+            "day": [
+                "2020-10-05",
+                "2020-10-12",
+                "2020-10-19",
+                "2020-10-26",
+                "2020-11-02",
+                "2020-11-03",
+            ],
+            "user_id": [1, 2, 3, 4, 5, 6],
+        }
+    ).with_columns(pl.col("day").str.strptime(pl.Date))
+
+    assert ts.get_last_week(df, "day")["user_id"].to_list() == [5, 6]
+    assert ts.get_last_weeks(df, "day")["user_id"].to_list() == [2, 3, 4]
+
+    lazy = ts.get_last_weeks(df.lazy(), "day")
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect()["user_id"].to_list() == [2, 3, 4]
+
+
+def test_lazy_output_resolves_week_anchors_once(monkeypatch) -> None:
+    dfs = {
+        "pays": df_pays_raw,
+        "taps": df_taps_flat_expected,
+        "prints": df_prints_flat_expected,
+    }
+    anchors = ts.week_anchors({k: v.lazy() for k, v in dfs.items()})
+    assert anchors == ts.week_anchors(dfs)
+    assert anchors["prints"] == ts.latest_weeks(dfs["prints"], "day", 4)
+
+    def no_collect(*args, **kwargs):
+        raise AssertionError("latest_weeks should not run per dataset")
+
+    monkeypatch.setattr(ts, "latest_weeks", no_collect)
+    eager = ts.build_output(dfs)
+    lazy = ts.build_output({k: v.lazy() for k, v in dfs.items()})
+    assert isinstance(lazy, pl.LazyFrame) and isinstance(eager, pl.DataFrame)
+    keys = ["day", "user_id", "value_prop"]
+    assert_frame_equal(lazy.collect().sort(keys), eager.sort(keys))
+
+
+def test_week_filters_empty_frame() -> None:
+    df = pl.DataFrame(schema={"day": pl.Date, "user_id": pl.Int64})
+    assert ts.get_last_week(df, "day").height == 0
+    assert ts.get_last_weeks(df.lazy(), "day").collect().height == 0
+
+
+def test_build_features_single_group_by() -> None:
+    day = pl.date(2020, 11, 2)
+    prints = pl.DataFrame(
+        {"user_id": [1, 1, 2], "value_prop": ["a", "a", "b"]}
+    ).with_columns(day.alias("day"))
+    taps = pl.DataFrame({"user_id": [1], "value_prop": ["a"]}).with_columns(
+        day.alias("day")
+    )
+    pays = pl.DataFrame(
+        {"user_id": [1, 2, 2], "value_prop": ["a", "b", "b"]}
+    ).with_columns(
+        day.alias("pay_date"), pl.Series("total", [10.5, 1.0, 2.9])
+    )
+
+    got = ts.build_features({"prints": prints, "taps": taps, "pays": pays})
+    assert isinstance(got, pl.DataFrame)
+    got = got.sort(ts.KEYS)
+
+    assert got.columns == [*ts.KEYS, *ts.COUNT_COLS, "total_pagos"]
+    assert got["cantidad_vistas"].to_list() == [2, 1]
+    assert got["cantidad_taps"].to_list() == [1, 0]
+    assert got["cantidad_pagos"].to_list() == [1, 2]
+    assert got["total_pagos"].to_list() == [10, 3]
+
+
+def test_as_of_uses_calendar_weeks_before_cutoff() -> None:
+    df = pl.DataFrame(
+        {
+            "day": [
+                "2020-10-04",
+                "2020-10-05",
+                "2020-10-25",
+                "2020-10-26",
+                "2020-10-28",
+                "2020-11-02",
+            ],
+            "user_id": [1, 2, 3, 4, 5, 6],
+        }
+    ).with_columns(pl.col("day").str.strptime(pl.Date))
+    as_of = date(2020, 10, 27)
+
+    assert ts.window_bounds(as_of) == (date(2020, 10, 5), as_of)
+    assert ts.get_last_week(df, "day", as_of)["user_id"].to_list() == [4]
+    assert ts.get_last_weeks(df, "day", as_of)["user_id"].to_list() == [2, 3]
+
+
+def test_build_output_aligns_feature_key_types() -> None:
+    enum = pl.Enum(["a", "b"])
+    prints = pl.DataFrame(
+        {
+            "day": [date(2020, 11, 2)] * 2,
+            "position": [0, 1],
+            "value_prop": pl.Series(["a", "b"], dtype=enum),
+            "user_id": [1, 1],
+        }
+    )
+    features = pl.DataFrame(
+        {
+            "user_id": [1],
+            "value_prop": ["b"],
+            "cantidad_vistas": [3],
+            "cantidad_taps": [1],
+            "cantidad_pagos": [0],
+            "total_pagos": [0],
+        }
+    )
+    out = ts.build_output({"prints": prints}, features=features)
+    assert isinstance(out, pl.DataFrame)
+    assert out.schema["value_prop"] == enum
+    assert out.sort("value_prop")["cantidad_vistas"].to_list() == [0, 3]
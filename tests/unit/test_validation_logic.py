@@ -110,6 +110,7 @@ def test_validate_raw_schema_csv_newcols_and_missing(tmp_path):
             "raw_path": str(csv),
             "raw_schema": {"colY": pl.Int64},
             "allow_new_columns": False,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=True)
@@ -131,6 +132,7 @@ def test_validate_raw_schema_ndjson_with_wrong_types(tmp_path):
             "raw_path": str(p),
             "raw_schema": {"x": pl.Int64},
             "allow_new_columns": True,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=True)
@@ -150,6 +152,7 @@ def test_validate_raw_schema_handles_read_error(tmp_path):
             "raw_path": str(tmp_path / "nofile.csv"),
             "raw_schema": {"a": pl.Int64},
             "allow_new_columns": False,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=True)
@@ -171,6 +174,7 @@ def test_validate_raw_schema_new_columns_allowed(tmp_path):
             "raw_path": str(csv),
             "raw_schema": {"colA": pl.Int64},
             "allow_new_columns": True,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=True)
@@ -190,6 +194,7 @@ def test_validate_raw_schema_strict_false_with_missing(tmp_path):
             "raw_path": str(p),
             "raw_schema": {"colA": pl.Int64, "colB": pl.Int64},
             "allow_new_columns": True,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=False)
@@ -210,6 +215,7 @@ def test_validate_raw_schema_strict_false_with_newcols_not_allowed(tmp_path):
             "raw_path": str(p),
             "raw_schema": {"colA": pl.Int64},
             "allow_new_columns": False,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=False)
@@ -230,6 +236,7 @@ def test_validate_raw_schema_wrong_types_and_newcols_combo(tmp_path):
             "raw_path": str(p),
             "raw_schema": {"x": pl.Int64},
             "allow_new_columns": False,
+            "compact_types": {},
         },
     )()
     ok, rp = val.validate_raw_schema(spec, strict=False)
@@ -360,3 +367,171 @@ def test_ndjson_keys_and_rowcount_errors_counted(tmp_path):
     p.write_text('{"k":1}\nnotjson\n{"k":2}\n')
     keys, n = val._ndjson_keys_and_rowcount(p)
     assert "k" in keys and n == 3
+
+
+def test_ndjson_profile_single_scan(tmp_path):
+    p = tmp_path / "p.json"
+    p.write_text(
+        "\n".join(
+            [
+                '{"u":1,"d":"2020-01-01","e":{"k":1}}',
+                "",
+                '{"u":"x","d":"nope","e":{"k":2},"extra":true}',
+                '{"u":3.5}',
+            ]
+        )
+    )
+    keys, rows, invalid = val._ndjson_profile(
+        str(p), {"u": pl.Int64, "d": pl.Date, "e": pl.Struct([])}
+    )
+    assert keys == {"u", "d", "e", "extra"}
+    assert rows == 3
+    assert invalid == {"u": 2, "d": 1}
+
+
+def test_validate_raw_schema_events_falls_back_on_malformed(tmp_path):
+    p = tmp_path / "bad.json"
+    p.write_text('{"k":1}\nnotjson\n{"k":"x"}\n')
+    spec = DatasetSpec(
+        name="evt_fallback",
+        kind="events",
+        raw_path=str(p),
+        raw_schema={"k": pl.Int64},
+        flat_expected_cols=[],
+    )
+    ok, rp = val.validate_raw_schema(spec, strict=True)
+    data = json.loads(Path(rp).read_text())
+    assert ok is False and data["rows"] == 3
+    assert data["wrong_types"] == [{"column": "k", "expected": "Int64"}]
+    _cleanup_report(rp)
+
+
+def test_read_validated_csv_returns_typed_frame(tmp_path):
+    p = tmp_path / "ok.csv"
+    p.write_text("a,d,f\n1,2020-01-02,true\n2,2020-01-03,false\n")
+    spec = DatasetSpec(
+        name="csv_validated",
+        kind="pays",
+        raw_path=str(p),
+        raw_schema={"a": pl.Int64, "d": pl.Date, "f": pl.Boolean},
+        flat_expected_cols=[],
+    )
+    df, ok, rp = val.read_validated(spec, strict=True)
+    assert ok is True and df is not None
+    assert df.schema == {"a": pl.Int64, "d": pl.Date, "f": pl.Boolean}
+    assert df["f"].to_list() == [True, False]
+    _cleanup_report(rp)
+
+
+def test_read_validated_ndjson_wrong_types_returns_none(tmp_path):
+    p = tmp_path / "bad.json"
+    p.write_text('{"u":1,"d":"2020-01-01"}\n{"u":"x","d":"2020-01-02"}\n')
+    spec = DatasetSpec(
+        name="evt_validated",
+        kind="events",
+        raw_path=str(p),
+        raw_schema={"u": pl.Int64, "d": pl.Date},
+        flat_expected_cols=[],
+    )
+    df, ok, rp = val.read_validated(spec, strict=True)
+    data = json.loads(Path(rp).read_text())
+    assert df is None and ok is False
+    assert data["rows"] == 2
+    assert data["wrong_types"] == [{"column": "u", "expected": "Int64"}]
+    _cleanup_report(rp)
+
+
+def test_validate_raw_schema_reports_compact_overflow(tmp_path):
+    p = tmp_path / "pays.csv"
+    p.write_text("user_id,total\n1,1.0\n-3,2.0\n5000000000,3.0\n")
+    spec = DatasetSpec(
+        name="pays_overflow",
+        kind="pays",
+        raw_path=str(p),
+        raw_schema={"user_id": pl.Int64, "total": pl.Float64},
+        flat_expected_cols=[],
+        compact_types={"user_id": pl.UInt32},
+    )
+    ok, rp = val.validate_raw_schema(spec, strict=True)
+    data = json.loads(Path(rp).read_text())
+    assert ok is False and data["wrong_types"] == []
+    assert data["overflow"] == [
+        {"column": "user_id", "compact_type": "UInt32", "rows": 2}
+    ]
+    _cleanup_report(rp)
+
+
+def test_read_validated_checks_nested_compact_field(tmp_path):
+    p = tmp_path / "ev.json"
+    p.write_text(
+        '{"day":"2020-11-01","event_data":{"position":3},"user_id":1}\n'
+        '{"day":"2020-11-02","event_data":{"position":300},"user_id":2}\n'
+    )
+    spec = DatasetSpec(
+        name="events_overflow",
+        kind="events",
+        raw_path=str(p),
+        raw_schema={
+            "day": pl.Date,
+            "event_data": pl.Struct([pl.Field("position", pl.Int64)]),
+            "user_id": pl.Int64,
+        },
+        flat_expected_cols=[],
+        compact_types={"position": pl.UInt8, "user_id": pl.UInt32},
+    )
+    df, ok, rp = val.read_validated(spec, strict=True)
+    data = json.loads(Path(rp).read_text())
+    assert df is None and ok is False
+    assert [o["column"] for o in data["overflow"]] == ["position"]
+
+    ok, rp = val.validate_raw_schema(spec, strict=True)
+    assert ok is False
+    assert json.loads(Path(rp).read_text())["overflow"][0]["rows"] == 1
+    _cleanup_report(rp)
+
+
+def test_ndjson_profile_sees_columns_past_inference_window(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(val, "_NDJSON_INFER_ROWS", 1)
+    p = tmp_path / "late.json"
+    p.write_text('{"u":1}\n{"u":"x","d":"2020-01-01"}\n')
+    keys, rows, invalid = val._ndjson_profile(
+        str(p), {"u": pl.Int64, "d": pl.Date, "z": pl.Int64}
+    )
+    assert keys == {"u", "d"} and rows == 2
+    assert invalid == {"u": 1}
+
+
+def test_ndjson_profile_counts_json_booleans_in_numeric_columns(tmp_path):
+    p = tmp_path / "bools.json"
+    p.write_text('{"u":true,"f":false}\n{"u":1,"f":1.5}\n')
+    _, _, invalid = val._ndjson_profile(
+        str(p), {"u": pl.Int64, "f": pl.Float64}
+    )
+    assert invalid == {"u": 1, "f": 1}
+
+
+def test_ndjson_fallback_counts_compact_overflow(tmp_path):
+    p = tmp_path / "ev.json"
+    p.write_text(
+        '{"user_id":1,"event_data":{"position":3}}\n'
+        "notjson\n"
+        '{"user_id":5000000000,"event_data":{"position":300}}\n'
+    )
+    spec = DatasetSpec(
+        name="evt_fallback_overflow",
+        kind="events",
+        raw_path=str(p),
+        raw_schema={"user_id": pl.Int64},
+        flat_expected_cols=[],
+        compact_types={"position": pl.UInt8, "user_id": pl.UInt32},
+    )
+    ok, rp = val.validate_raw_schema(spec, strict=True)
+    data = json.loads(Path(rp).read_text())
+    assert ok is False and data["wrong_types"] == []
+    assert data["overflow"] == [
+        {"column": "position", "compact_type": "UInt8", "rows": 1},
+        {"column": "user_id", "compact_type": "UInt32", "rows": 1},
+    ]
+    _cleanup_report(rp)
@@ -0,0 +1,216 @@
+from dataclasses import replace
+from datetime import date, timedelta
+from pathlib import Path
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+import src.application.weekly_store as ws
+from src.application.transform_service import (
+    KEYS,
+    build_features,
+    build_output,
+)
+
+
+def _dfs() -> dict[str, pl.DataFrame]:
+    start = date(2020, 10, 5)
+    days = [start + timedelta(days=3 * i) for i in range(12)]
+    events = pl.DataFrame(
+        {
+            "day": days,
+            "position": [i % 3 for i in range(12)],
+            "value_prop": ["a", "b", "c"] * 4,
+            "user_id": [1, 2] * 6,
+        }
+    )
+    pays = pl.DataFrame(
+        {
+            "pay_date": days,
+            "total": [float(i) + 0.5 for i in range(12)],
+            "user_id": [1, 2] * 6,
+            "value_prop": ["a", "b", "c"] * 4,
+        }
+    )
+    return {"prints": events, "taps": events.head(6), "pays": pays}
+
+
+def _store(tmp_path, monkeypatch) -> dict:
+    monkeypatch.setattr(ws, "OUT_DATA_DIR", str(tmp_path / "out"))
+    specs = {}
+    for name, spec in ws.DATASETS.items():
+        raw = tmp_path / "raw" / name
+        raw.parent.mkdir(exist_ok=True)
+        raw.write_text(name)
+        curated = tmp_path / "curated" / name
+        for week in ("2020-10-12", "2020-10-19", "2020-10-26"):
+            part = curated / f"week_start={week}"
+            part.mkdir(parents=True)
+            (part / "0.parquet").write_text(name)
+        specs[name] = replace(
+            spec, raw_path=str(raw), curated_path=str(curated)
+        )
+    monkeypatch.setattr(ws, "DATASETS", specs)
+    return specs
+
+
+def test_history_weeks_are_three_previous_mondays():
+    assert ws.history_weeks(date(2020, 11, 2)) == [
+        date(2020, 10, 12),
+        date(2020, 10, 19),
+        date(2020, 10, 26),
+    ]
+
+
+def test_incremental_features_match_full_recompute(tmp_path, monkeypatch):
+    _store(tmp_path, monkeypatch)
+    dfs = _dfs()
+    as_of = date(2020, 11, 3)
+
+    got = ws.incremental_features(dfs, as_of)
+    exp = build_features(dfs, as_of)
+    assert got is not None and isinstance(exp, pl.DataFrame)
+    assert_frame_equal(got.sort(KEYS), exp.sort(KEYS))
+
+    store = tmp_path / "out"
+    parts = sorted(p.parent.name for p in store.rglob("*.parquet"))
+    assert parts == [
+        "week_start=2020-10-12",
+        "week_start=2020-10-19",
+        "week_start=2020-10-26",
+    ]
+
+
+def test_incremental_features_reuse_stored_weeks(tmp_path, monkeypatch):
+    _store(tmp_path, monkeypatch)
+    dfs = _dfs()
+    first = ws.incremental_features(dfs, date(2020, 11, 2))
+
+    only_last_week = {
+        k: v.filter(pl.col(v.columns[0]) >= date(2020, 11, 2))
+        for k, v in dfs.items()
+    }
+    again = ws.incremental_features(only_last_week, date(2020, 11, 2))
+    assert first is not None and again is not None
+    assert_frame_equal(first.sort(KEYS), again.sort(KEYS))
+
+
+def test_incremental_features_without_prints_returns_none():
+    empty = pl.DataFrame(schema={"day": pl.Date})
+    assert ws.incremental_features({"prints": empty}) is None
+
+
+def test_spilled_features_match_full_recompute(tmp_path):
+    dfs = {k: v.lazy() for k, v in _dfs().items()}
+    as_of = date(2020, 11, 3)
+    spill_dir = str(tmp_path / "spill")
+
+    got = ws.spilled_features(dfs, spill_dir, as_of)
+    exp = build_features(_dfs(), as_of)
+    assert got is not None and isinstance(exp, pl.DataFrame)
+    assert_frame_equal(got.collect().sort(KEYS), exp.sort(KEYS))
+    assert len(list((tmp_path / "spill").glob("*.parquet"))) == 3
+
+
+def test_spilled_features_use_per_dataset_anchors(tmp_path):
+    dfs = _dfs()
+    got = ws.spilled_features(dfs, str(tmp_path / "spill"))
+    assert got is not None
+    want = build_features(dfs)
+    assert_frame_equal(
+        got.collect().sort(KEYS), want.sort(KEYS), check_dtypes=False
+    )
+
+
+def test_backfill_weeks_cover_range():
+    assert ws.backfill_weeks(date(2020, 10, 21), date(2020, 11, 2)) == [
+        date(2020, 10, 19),
+        date(2020, 10, 26),
+        date(2020, 11, 2),
+    ]
+
+
+def test_backfill_matches_one_run_per_week(tmp_path):
+    dfs = _dfs()
+    target = ws.backfill_and_export(
+        dfs, date(2020, 10, 19), date(2020, 11, 2), str(tmp_path / "bf")
+    )
+    got = pl.read_parquet(
+        f"{target}/**/*.parquet",
+        hive_partitioning=True,
+        hive_schema={"week_start": pl.Date},
+    )
+    for week in ws.backfill_weeks(date(2020, 10, 19), date(2020, 11, 2)):
+        exp = build_output(dfs, week + timedelta(days=6))
+        assert isinstance(exp, pl.DataFrame)
+        part = got.filter(pl.col("week_start") == week).drop("week_start")
+        assert part.height == exp.height > 0
+        assert_frame_equal(
+            part.sort(["day", *KEYS]), exp.sort(["day", *KEYS])
+        )
+
+
+def test_failed_backfill_keeps_previous_output(tmp_path, monkeypatch):
+    first, last = date(2020, 10, 19), date(2020, 11, 2)
+    target = ws.backfill_and_export(_dfs(), first, last, str(tmp_path / "bf"))
+    before = sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*"))
+
+    bad = pl.LazyFrame({"week_start": [first], "x": ["a"]}).with_columns(
+        pl.col("x").str.to_integer()
+    )
+    monkeypatch.setattr(ws, "backfill_output", lambda *args: bad)
+    with pytest.raises(pl.exceptions.PolarsError):
+        ws.backfill_and_export(_dfs(), first, last, target)
+    assert sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*")) == (
+        before
+    )
+
+
+def test_incremental_features_recompute_weeks_whose_inputs_changed(
+    tmp_path, monkeypatch
+):
+    specs = _store(tmp_path, monkeypatch)
+    as_of = date(2020, 11, 3)
+    ws.incremental_features(_dfs(), as_of)
+
+    dfs = _dfs()
+    dfs["pays"] = dfs["pays"].with_columns(pl.col("total") * 10)
+    Path(specs["pays"].raw_path).write_text("pays, appended")
+    got = ws.incremental_features(dfs, as_of)
+    exp = build_features(dfs, as_of)
+    assert got is not None and isinstance(exp, pl.DataFrame)
+    assert_frame_equal(got.sort(KEYS), exp.sort(KEYS))
+
+
+def test_curated_store_invalidates_only_changed_partitions(
+    tmp_path, monkeypatch
+):
+    specs = _store(tmp_path, monkeypatch)
+    computed = []
+    aggregates = ws.weekly_aggregates
+    monkeypatch.setattr(
+        ws,
+        "weekly_aggregates",
+        lambda dfs, weeks: computed.append(weeks) or aggregates(dfs, weeks),
+    )
+    as_of = date(2020, 11, 3)
+    ws.incremental_features(_dfs(), as_of, source="curated")
+    ws.incremental_features(_dfs(), as_of, source="curated")
+    assert len(computed) == 1
+
+    part = Path(specs["taps"].curated_path) / "week_start=2020-10-19"
+    (part / "1.parquet").write_text("late taps")
+    ws.incremental_features(_dfs(), as_of, source="curated")
+    assert computed[1:] == [[date(2020, 10, 19)]]
+
+
+def test_incremental_features_use_per_dataset_anchors(tmp_path, monkeypatch):
+    _store(tmp_path, monkeypatch)
+    dfs = _dfs()
+    assert dfs["taps"]["day"].max() < dfs["prints"]["day"].max()
+    for _ in range(2):
+        got = ws.incremental_features(dfs)
+        exp = build_features(dfs)
+        assert got is not None and isinstance(exp, pl.DataFrame)
+        assert_frame_equal(
+            got.sort(KEYS), exp.sort(KEYS), check_dtypes=False
+        )